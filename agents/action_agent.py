@@ -1,13 +1,17 @@
+import asyncio
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from .schemas import Incident, ActionResult
 from .config import STRANDS_ENABLE_LLM
-from .agent_factory import build_agent
+from .agent_factory import agent_session
+from .deadline import LLMTimeout, call_with_deadline
 from .prompts import ACTION_PROMPT
-from .mcp_tools import call_gateway_tool, list_gateway_tools
+from .tracing import traced
+from .mcp_tools import acall_gateway_tool, call_gateway_tool, leased_gateway_tools
+from .remediation import get_remediation_guard
 from .tool_registry import resolve_tool_name
-from .workflows import ActionStep, select_workflow
+from .workflows import ActionStep, WorkflowSpec, select_workflow
 
 
 def _action_result(intent: str, actions: List[Dict[str, Any]], status: str) -> ActionResult:
@@ -17,38 +21,90 @@ def _action_result(intent: str, actions: List[Dict[str, Any]], status: str) -> A
 def _run_action_step(incident: Incident, step: ActionStep) -> Dict[str, Any]:
     tool = resolve_tool_name(step.tool_suffix)
     ctx = incident.context.get(step.context_key, {}) if step.context_key else {}
-    return call_gateway_tool(tool, ctx)
+    return get_remediation_guard().run(step.tool_suffix, ctx, lambda: call_gateway_tool(tool, ctx, idempotent=False))
 
 
-def _rule_based(incident: Incident, intent: str) -> ActionResult:
-    workflow = select_workflow(intent, incident)
-    actions: List[Dict[str, Any]] = []
+async def _arun_action_step(incident: Incident, step: ActionStep) -> Dict[str, Any]:
+    tool = resolve_tool_name(step.tool_suffix)
+    ctx = incident.context.get(step.context_key, {}) if step.context_key else {}
+    return await get_remediation_guard().arun(
+        step.tool_suffix, ctx, lambda: acall_gateway_tool(tool, ctx, idempotent=False)
+    )
 
+
+def _blocked(workflow: WorkflowSpec, intent: str) -> Optional[ActionResult]:
     if not workflow.auto_retry_allowed and workflow.action_steps:
-        actions.append(
+        actions = [
             {
                 "policy_block": (
                     f"Workflow {workflow.workflow_id} blocks automatic retries; escalate for manual approval"
                 )
             }
-        )
+        ]
         return _action_result(intent, actions, status="blocked")
+    return None
+
 
+def _runnable_steps(incident: Incident, workflow: WorkflowSpec) -> List[ActionStep]:
+    steps: List[ActionStep] = []
     for step in workflow.action_steps:
         ctx = incident.context.get(step.context_key, {}) if step.context_key else {}
         if step.context_key and not ctx and step.optional:
             continue
+        steps.append(step)
+    return steps
+
+
+def _abandoned(intent: str, exc: LLMTimeout) -> ActionResult:
+    actions = [
+        {
+            "policy_block": (
+                f"{exc}; the action agent may still have tool calls in flight, "
+                "so remediation is not replayed. Escalate for manual review"
+            )
+        }
+    ]
+    return _action_result(intent, actions, status="blocked")
+
 
+def _completed(workflow: WorkflowSpec, intent: str, actions: List[Dict[str, Any]]) -> ActionResult:
+    if not actions:
+        actions.append({"noop": f"No automated action for workflow {workflow.workflow_id}"})
+    return _action_result(intent, actions, status="completed")
+
+
+def _rule_based(incident: Incident, intent: str) -> ActionResult:
+    workflow = select_workflow(intent, incident)
+    blocked = _blocked(workflow, intent)
+    if blocked is not None:
+        return blocked
+
+    actions: List[Dict[str, Any]] = []
+    for step in _runnable_steps(incident, workflow):
         try:
             action_result = _run_action_step(incident, step)
             actions.append({step.action_key: action_result})
         except Exception as exc:
             actions.append({step.action_key: {"error": str(exc)}})
 
-    if not actions:
-        actions.append({"noop": f"No automated action for workflow {workflow.workflow_id}"})
+    return _completed(workflow, intent, actions)
 
-    return _action_result(intent, actions, status="completed")
+
+async def _arule_based(incident: Incident, intent: str) -> ActionResult:
+    workflow = select_workflow(intent, incident)
+    blocked = _blocked(workflow, intent)
+    if blocked is not None:
+        return blocked
+
+    actions: List[Dict[str, Any]] = []
+    for step in _runnable_steps(incident, workflow):
+        try:
+            action_result = await _arun_action_step(incident, step)
+            actions.append({step.action_key: action_result})
+        except Exception as exc:
+            actions.append({step.action_key: {"error": str(exc)}})
+
+    return _completed(workflow, intent, actions)
 
 
 def _parse_llm_result(result: Any) -> ActionResult:
@@ -58,13 +114,13 @@ def _parse_llm_result(result: Any) -> ActionResult:
     return ActionResult(**data)
 
 
+@traced("llm.act")
 def _llm_act(incident: Incident, intent: str) -> ActionResult:
-    tools = list_gateway_tools()
-    agent = build_agent(ACTION_PROMPT, tools=tools)
     payload = incident.model_dump()
     payload["intent"] = intent
     payload["workflow_id"] = select_workflow(intent, incident).workflow_id
-    result = agent(json.dumps(payload))
+    with leased_gateway_tools() as tools, agent_session(ACTION_PROMPT, tools=tools) as agent:
+        result = agent(json.dumps(payload))
     return _parse_llm_result(result)
 
 
@@ -73,6 +129,24 @@ def act(incident: Incident, intent: str, force_rule_based: bool = False) -> Acti
         return _rule_based(incident, intent)
 
     try:
-        return _llm_act(incident, intent)
+        return call_with_deadline(_llm_act, incident, intent)
+    except LLMTimeout as exc:
+        if exc.abandoned:
+            return _abandoned(intent, exc)
+        return _rule_based(incident, intent)
     except Exception:
         return _rule_based(incident, intent)
+
+
+async def aact(incident: Incident, intent: str, force_rule_based: bool = False) -> ActionResult:
+    if force_rule_based or not STRANDS_ENABLE_LLM:
+        return await _arule_based(incident, intent)
+
+    try:
+        return await asyncio.to_thread(call_with_deadline, _llm_act, incident, intent)
+    except LLMTimeout as exc:
+        if exc.abandoned:
+            return _abandoned(intent, exc)
+        return await _arule_based(incident, intent)
+    except Exception:
+        return await _arule_based(incident, intent)
@@ -1,8 +1,126 @@
-﻿from strands import Agent
+﻿import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from strands import Agent
 from strands.models import BedrockModel
-from .config import BEDROCK_REGION, MODEL_ID
+from .config import AGENT_CACHE_SIZE, AGENT_POOL_SIZE, BEDROCK_REGION, MODEL_ID
+
+
+_models: Dict[Tuple[str, str], BedrockModel] = {}
+_models_lock = threading.Lock()
+
+
+def _model(model_id: str = MODEL_ID, region: str = BEDROCK_REGION) -> BedrockModel:
+    key = (model_id, region)
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                model = BedrockModel(model_id=model_id, region=region)
+                _models[key] = model
+    return model
 
 
 def build_agent(system_prompt: str, tools=None) -> Agent:
-    model = BedrockModel(model_id=MODEL_ID, region=BEDROCK_REGION)
-    return Agent(system_prompt=system_prompt, model=model, tools=tools or [])
+    return Agent(system_prompt=system_prompt, model=_model(), tools=tools or [])
+
+
+def _tool_name(tool: Any) -> str:
+    for attr in ("tool_name", "name", "__name__"):
+        value = getattr(tool, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return repr(tool)
+
+
+def tool_fingerprint(tools: Optional[Sequence[Any]]) -> Tuple[Hashable, ...]:
+    return tuple(sorted((_tool_name(tool), id(getattr(tool, "mcp_client", None))) for tool in tools or []))
+
+
+def _reset(agent: Agent) -> None:
+    messages = getattr(agent, "messages", None)
+    if isinstance(messages, list):
+        messages.clear()
+
+
+class _AgentPool:
+    def __init__(self, system_prompt: str, tools: List[Any], size: int) -> None:
+        self.system_prompt = system_prompt
+        self.tools = tools
+        self.size = max(1, size)
+        self._idle: List[Agent] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Agent:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return build_agent(self.system_prompt, tools=self.tools)
+
+    def release(self, agent: Agent) -> None:
+        _reset(agent)
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(agent)
+
+    def fill(self, count: int) -> None:
+        while True:
+            with self._lock:
+                if len(self._idle) >= min(count, self.size):
+                    return
+            agent = build_agent(self.system_prompt, tools=self.tools)
+            with self._lock:
+                self._idle.append(agent)
+
+
+_pools: "OrderedDict[Tuple[Hashable, ...], _AgentPool]" = OrderedDict()
+_pools_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _pool(system_prompt: str, tools: Optional[Sequence[Any]]) -> _AgentPool:
+    key = (system_prompt, tool_fingerprint(tools), MODEL_ID)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is not None:
+            _pools.move_to_end(key)
+            _stats["hits"] += 1
+            return pool
+        _stats["misses"] += 1
+        pool = _AgentPool(system_prompt, list(tools or []), AGENT_POOL_SIZE)
+        _pools[key] = pool
+        while len(_pools) > max(1, AGENT_CACHE_SIZE):
+            _pools.popitem(last=False)
+            _stats["evictions"] += 1
+        return pool
+
+
+@contextmanager
+def agent_session(system_prompt: str, tools=None) -> Iterator[Agent]:
+    pool = _pool(system_prompt, tools)
+    agent = pool.acquire()
+    try:
+        yield agent
+    finally:
+        pool.release(agent)
+
+
+def warm_agent(system_prompt: str, tools=None, count: int = 1) -> None:
+    _pool(system_prompt, tools).fill(count)
+
+
+def agent_cache_stats() -> Dict[str, Any]:
+    with _pools_lock:
+        stats: Dict[str, Any] = dict(_stats)
+        stats["pools"] = len(_pools)
+        stats["idle_agents"] = sum(len(pool._idle) for pool in _pools.values())
+    return stats
+
+
+def clear_agent_cache() -> None:
+    with _pools_lock:
+        _pools.clear()
+        for key in _stats:
+            _stats[key] = 0
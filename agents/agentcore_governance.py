@@ -1,6 +1,7 @@
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
 from .config import (
@@ -8,11 +9,16 @@ from .config import (
     AGENTCORE_EVALUATION_STRICT,
     AGENTCORE_EVALUATOR_ID,
     AGENTCORE_MIN_EVAL_SCORE,
+    AGENTCORE_POLICY_CACHE_ERROR_TTL_SECONDS,
+    AGENTCORE_POLICY_CACHE_STALE_SECONDS,
+    AGENTCORE_POLICY_CACHE_TTL_SECONDS,
     AGENTCORE_POLICY_ENABLED,
     AGENTCORE_POLICY_ENGINE_ID,
     AGENTCORE_POLICY_STRICT,
     AWS_REGION,
 )
+from .aws_clients import get_client
+from .tracing import traced
 
 RESTRICTIVENESS = {
     "auto_close": 0,
@@ -28,17 +34,155 @@ def _more_restrictive(left: str, right: str) -> str:
 
 
 def _control_client():
-    return boto3.client("bedrock-agentcore-control", region_name=AWS_REGION)
+    return get_client("bedrock-agentcore-control", AWS_REGION)
 
 
 def _runtime_client():
-    return boto3.client("bedrock-agentcore", region_name=AWS_REGION)
+    return get_client("bedrock-agentcore", AWS_REGION)
 
 
 def _safe_error(exc: Exception) -> str:
     return f"{exc.__class__.__name__}: {exc}"
 
 
+class _PolicyContextCache:
+    def __init__(self, ttl: float, stale: float, error_ttl: float) -> None:
+        self.ttl = ttl
+        self.stale = stale
+        self.error_ttl = error_ttl
+        self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()
+        self._value: Optional[Dict[str, Any]] = None
+        self._expires_at = 0.0
+        self._stale_until = 0.0
+        self._next_refresh_at = 0.0
+        self._refreshing = False
+        self._counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+        }
+
+    def _store(self, value: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        if value.get("error"):
+            self._expires_at = now + self.error_ttl
+            self._stale_until = self._expires_at
+        else:
+            self._expires_at = now + self.ttl
+            self._stale_until = self._expires_at + self.stale
+        self._value = value
+
+    def _lookup(self, now: float) -> Tuple[Optional[Dict[str, Any]], str]:
+        value = self._value
+        if value is None:
+            return None, "miss"
+        if now < self._expires_at:
+            return value, "negative_hit" if value.get("error") else "hit"
+        if now < self._stale_until:
+            return value, "stale_hit"
+        return None, "miss"
+
+    def _refresh_failed(self) -> None:
+        self._counters["refresh_errors"] += 1
+        self._next_refresh_at = time.monotonic() + self.error_ttl
+
+    def _refresh(self, loader: Callable[[], Dict[str, Any]]) -> None:
+        try:
+            value = loader()
+            with self._lock:
+                self._counters["refreshes"] += 1
+                if value.get("error"):
+                    self._refresh_failed()
+                else:
+                    self._store(value)
+        except Exception:
+            with self._lock:
+                self._refresh_failed()
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def get(self, loader: Callable[[], Dict[str, Any]]) -> Tuple[Dict[str, Any], str]:
+        if self.ttl <= 0:
+            with self._lock:
+                self._counters["misses"] += 1
+            return loader(), "disabled"
+
+        with self._lock:
+            now = time.monotonic()
+            value, status = self._lookup(now)
+            if value is not None:
+                self._counters[status + "s"] += 1
+                if status == "stale_hit" and not self._refreshing and now >= self._next_refresh_at:
+                    self._refreshing = True
+                    threading.Thread(target=self._refresh, args=(loader,), daemon=True).start()
+                return value, status
+
+        with self._fetch_lock:
+            with self._lock:
+                value, status = self._lookup(time.monotonic())
+                if value is not None:
+                    self._counters[status + "s"] += 1
+                    return value, status
+                self._counters["misses"] += 1
+            value = loader()
+            with self._lock:
+                self._store(value)
+            return value, "miss"
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+        stats.update({"ttl_seconds": self.ttl, "stale_seconds": self.stale, "error_ttl_seconds": self.error_ttl})
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._value = None
+            self._expires_at = 0.0
+            self._stale_until = 0.0
+            self._next_refresh_at = 0.0
+            for key in self._counters:
+                self._counters[key] = 0
+
+
+_policy_cache = _PolicyContextCache(
+    ttl=AGENTCORE_POLICY_CACHE_TTL_SECONDS,
+    stale=AGENTCORE_POLICY_CACHE_STALE_SECONDS,
+    error_ttl=AGENTCORE_POLICY_CACHE_ERROR_TTL_SECONDS,
+)
+
+
+def policy_cache_stats() -> Dict[str, Any]:
+    return _policy_cache.stats()
+
+
+def reset_policy_cache() -> None:
+    _policy_cache.clear()
+
+
+def _load_policy_engine() -> Dict[str, Any]:
+    try:
+        client = _control_client()
+        engine = client.get_policy_engine(policyEngineId=AGENTCORE_POLICY_ENGINE_ID)
+        policies = client.list_policies(policyEngineId=AGENTCORE_POLICY_ENGINE_ID, maxResults=20)
+        policy_items = policies.get("policies", [])
+        return {
+            "ok": True,
+            "engine_status": engine.get("status", "UNKNOWN"),
+            "engine_name": engine.get("name"),
+            "policy_count": len(policy_items),
+            "policy_statuses": [str(item.get("status", "UNKNOWN")) for item in policy_items],
+        }
+    except (ClientError, BotoCoreError, Exception) as exc:
+        return {"error": _safe_error(exc)}
+
+
+@traced("governance.fetch_policy_context")
 def fetch_policy_context() -> Dict[str, Any]:
     context: Dict[str, Any] = {
         "enabled": AGENTCORE_POLICY_ENABLED,
@@ -52,24 +196,10 @@ def fetch_policy_context() -> Dict[str, Any]:
         context["error"] = "AGENTCORE_POLICY_ENGINE_ID is required when AGENTCORE_POLICY_ENABLED=1"
         return context
 
-    try:
-        client = _control_client()
-        engine = client.get_policy_engine(policyEngineId=AGENTCORE_POLICY_ENGINE_ID)
-        policies = client.list_policies(policyEngineId=AGENTCORE_POLICY_ENGINE_ID, maxResults=20)
-        policy_items = policies.get("policies", [])
-        context.update(
-            {
-                "ok": True,
-                "engine_status": engine.get("status", "UNKNOWN"),
-                "engine_name": engine.get("name"),
-                "policy_count": len(policy_items),
-                "policy_statuses": [str(item.get("status", "UNKNOWN")) for item in policy_items],
-            }
-        )
-        return context
-    except (ClientError, BotoCoreError, Exception) as exc:
-        context["error"] = _safe_error(exc)
-        return context
+    engine_context, cache_status = _policy_cache.get(_load_policy_engine)
+    context.update(engine_context)
+    context["cache_status"] = cache_status
+    return context
 
 
 def _extract_numeric_scores(value: Any) -> List[float]:
@@ -116,6 +246,7 @@ def _build_evaluation_input(
     }
 
 
+@traced("governance.run_online_evaluation")
 def run_online_evaluation(
     evaluator_id: str,
     evaluation_input: Dict[str, Any],
@@ -187,11 +318,13 @@ def apply_agentcore_governance(
     workflow_profile: Dict[str, Any],
     decision: str,
     evaluation: Dict[str, Any],
+    policy_context: Optional[Dict[str, Any]] = None,
 ) -> Tuple[Dict[str, Any], str, List[str]]:
     governance: Dict[str, Any] = {}
 
-    policy_context = fetch_policy_context()
-    governance["policy"] = policy_context
+    if policy_context is None:
+        policy_context = fetch_policy_context()
+    governance["policy"] = dict(policy_context)
 
     evaluation_context: Dict[str, Any] = {
         "enabled": AGENTCORE_EVALUATION_ENABLED,
@@ -219,6 +352,8 @@ def apply_agentcore_governance(
             evaluation_context["enabled"] = True
 
     governance["evaluation"] = evaluation_context
+    if AGENTCORE_POLICY_ENABLED:
+        governance["policy_cache"] = policy_cache_stats()
 
     updated_decision, reasons = enforce_governance_outcome(
         decision=decision,
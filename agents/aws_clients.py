@@ -0,0 +1,44 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+from .config import AWS_MAX_POOL_CONNECTIONS, AWS_REGION, AWS_TCP_KEEPALIVE
+
+
+_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_LOCK = threading.Lock()
+_SESSION: Optional[boto3.session.Session] = None
+
+
+def _client_config() -> Config:
+    return Config(
+        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=AWS_TCP_KEEPALIVE,
+        retries={"mode": "standard"},
+    )
+
+
+def get_client(service: str, region: Optional[str] = None) -> Any:
+    global _SESSION
+    key = (service, region or AWS_REGION)
+    client = _CLIENTS.get(key)
+    if client is not None:
+        return client
+
+    with _LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            if _SESSION is None:
+                _SESSION = boto3.session.Session()
+            client = _SESSION.client(service, region_name=key[1], config=_client_config())
+            _CLIENTS[key] = client
+        return client
+
+
+def clear_clients() -> None:
+    global _SESSION
+    with _LOCK:
+        _CLIENTS.clear()
+        _SESSION = None
@@ -0,0 +1,139 @@
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _shingles(tokens: Sequence[str]) -> Set[str]:
+    if len(tokens) < 2:
+        return set(tokens)
+    return {f"{tokens[i]} {tokens[i + 1]}" for i in range(len(tokens) - 1)}
+
+
+class MinHashIndex:
+    def __init__(self, threshold: float, maxsize: int, num_perm: int = 64, bands: int = 16, seed: int = 1) -> None:
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(self.rows * bands)
+        ]
+        self._signatures: "OrderedDict[Hashable, Tuple[int, ...]]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and 0 < self.threshold <= 1
+
+    def signature(self, tokens: Sequence[str]) -> Tuple[int, ...]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+            for shingle in _shingles(tokens)
+        ]
+        if not hashes:
+            return tuple(_MAX_HASH for _ in self._perms)
+        return tuple(min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in self._perms)
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [(band, signature[band * self.rows : (band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _remove_locked(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band in self._bands(signature):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+
+    def add(self, key: Hashable, tokens: Sequence[str]) -> None:
+        if not self.enabled:
+            return
+        signature = self.signature(tokens)
+        with self._lock:
+            self._remove_locked(key)
+            self._signatures[key] = signature
+            for band in self._bands(signature):
+                self._buckets.setdefault(band, set()).add(key)
+            while len(self._signatures) > self.maxsize:
+                self._remove_locked(next(iter(self._signatures)))
+
+    def query(self, tokens: Sequence[str]) -> Optional[Tuple[Hashable, float]]:
+        if not self.enabled:
+            return None
+        signature = self.signature(tokens)
+        best: Optional[Tuple[Hashable, float]] = None
+        with self._lock:
+            candidates: Set[Hashable] = set()
+            for band in self._bands(signature):
+                candidates.update(self._buckets.get(band, ()))
+            for key in candidates:
+                other = self._signatures[key]
+                similarity = sum(1 for x, y in zip(signature, other) if x == y) / len(signature)
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (key, similarity)
+        return best
+
+    def clear(self) -> None:
+        with self._lock:
+            self._signatures.clear()
+            self._buckets.clear()
@@ -0,0 +1,74 @@
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import TTLCache
+from .config import COALESCE_ENABLED, COALESCE_WINDOW_SECONDS, COALESCE_WINDOW_SIZE
+from .schemas import Incident
+from .workflows import select_workflow
+
+
+def coalesce_key(incident: Incident, intent: str) -> Optional[str]:
+    if not COALESCE_ENABLED or not isinstance(incident.context, dict):
+        return None
+    workflow = select_workflow(intent, incident)
+    context_keys = sorted(
+        {step.context_key for step in workflow.investigation_steps if step.context_key}
+        | {step.context_key for step in workflow.action_steps if step.context_key}
+    )
+    targets = {key: incident.context[key] for key in context_keys if incident.context.get(key)}
+    if not targets:
+        return None
+    return f"{workflow.workflow_id}|{json.dumps(targets, sort_keys=True, default=str)}"
+
+
+class Coalescer:
+    def __init__(self, window: float = COALESCE_WINDOW_SECONDS, maxsize: int = COALESCE_WINDOW_SIZE) -> None:
+        self._inflight: Dict[str, Future] = {}
+        self._recent = TTLCache(maxsize, window)
+        self._lock = threading.Lock()
+
+    def claim(self, key: str) -> Tuple[str, Future]:
+        with self._lock:
+            recent = self._recent.get(key)
+            if recent is not None:
+                future: Future = Future()
+                future.set_result(recent)
+                return "window", future
+            future = self._inflight.get(key)
+            if future is not None:
+                return "member", future
+            future = Future()
+            self._inflight[key] = future
+            return "leader", future
+
+    def complete(self, key: str, future: Future, result: Any) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._recent.set(key, result)
+        if not future.cancelled():
+            future.set_result(result)
+
+    def fail(self, key: str, future: Future, exc: BaseException) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if not future.cancelled():
+            future.set_exception(exc)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recent.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = self._recent.stats()
+            stats["inflight"] = len(self._inflight)
+        return stats
+
+
+_coalescer = Coalescer()
+
+
+def get_coalescer() -> Coalescer:
+    return _coalescer
@@ -1,23 +1,92 @@
 import os
+import tempfile
 
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 BEDROCK_REGION = os.getenv("BEDROCK_REGION", AWS_REGION)
 MODEL_ID = os.getenv("MODEL_ID", "anthropic.claude-3-5-sonnet-20240620-v1:0")
+AGENT_CACHE_SIZE = int(os.getenv("AGENT_CACHE_SIZE", "16"))
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", "4"))
+INCIDENT_LATENCY_BUDGET_SECONDS = float(os.getenv("INCIDENT_LATENCY_BUDGET_SECONDS", "120"))
+LLM_CALL_TIMEOUT_SECONDS = float(os.getenv("LLM_CALL_TIMEOUT_SECONDS", "45"))
+LLM_FALLBACK_RESERVE_SECONDS = float(os.getenv("LLM_FALLBACK_RESERVE_SECONDS", "15"))
+LLM_MAX_WORKERS = int(os.getenv("LLM_MAX_WORKERS", "16"))
+LLM_SPECULATIVE = os.getenv("LLM_SPECULATIVE", "0") == "1"
+INTENT_CACHE_SIZE = int(os.getenv("INTENT_CACHE_SIZE", "1024"))
+INTENT_CACHE_TTL_SECONDS = float(os.getenv("INTENT_CACHE_TTL_SECONDS", "900"))
+INTENT_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("INTENT_CACHE_SIMILARITY_THRESHOLD", "0"))
+
+AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "32"))
+AWS_TCP_KEEPALIVE = os.getenv("AWS_TCP_KEEPALIVE", "1") == "1"
 
 GATEWAY_CONFIG_PATH = os.getenv("GATEWAY_CONFIG_PATH", "agentcore/gateway_config.json")
 GATEWAY_URL = os.getenv("GATEWAY_URL", "")
 GATEWAY_REGION = os.getenv("GATEWAY_REGION", AWS_REGION)
 
+TOOL_REGISTRY_CACHE_PATH = os.getenv("TOOL_REGISTRY_CACHE_PATH") or os.path.join(
+    tempfile.gettempdir(), "l1agent_tool_registry.json"
+)
+TOOL_REGISTRY_TTL_SECONDS = float(os.getenv("TOOL_REGISTRY_TTL_SECONDS", "900"))
+TOOL_REGISTRY_ERROR_TTL_SECONDS = float(os.getenv("TOOL_REGISTRY_ERROR_TTL_SECONDS", "60"))
+TOOL_SEARCH_CACHE_SIZE = int(os.getenv("TOOL_SEARCH_CACHE_SIZE", "256"))
+TOOL_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("TOOL_SEARCH_CACHE_TTL_SECONDS", "900"))
+GATEWAY_MAX_INFLIGHT = int(os.getenv("GATEWAY_MAX_INFLIGHT", "32"))
+GATEWAY_POOL_SIZE = int(os.getenv("GATEWAY_POOL_SIZE", "4"))
+GATEWAY_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("GATEWAY_POOL_ACQUIRE_TIMEOUT_SECONDS", "30"))
+GATEWAY_SESSION_IDLE_CHECK_SECONDS = float(os.getenv("GATEWAY_SESSION_IDLE_CHECK_SECONDS", "60"))
+GATEWAY_TOKEN_DEFAULT_TTL_SECONDS = float(os.getenv("GATEWAY_TOKEN_DEFAULT_TTL_SECONDS", "3600"))
+GATEWAY_TOKEN_REFRESH_MARGIN_SECONDS = float(os.getenv("GATEWAY_TOKEN_REFRESH_MARGIN_SECONDS", "300"))
+GATEWAY_HTTP_POOL_SIZE = int(os.getenv("GATEWAY_HTTP_POOL_SIZE", "16"))
+GATEWAY_HTTP_TIMEOUT_SECONDS = float(os.getenv("GATEWAY_HTTP_TIMEOUT_SECONDS", "30"))
+GATEWAY_HTTP_MAX_RETRIES = int(os.getenv("GATEWAY_HTTP_MAX_RETRIES", "3"))
+GATEWAY_HTTP_BACKOFF_BASE_SECONDS = float(os.getenv("GATEWAY_HTTP_BACKOFF_BASE_SECONDS", "0.2"))
+GATEWAY_HTTP_BACKOFF_MAX_SECONDS = float(os.getenv("GATEWAY_HTTP_BACKOFF_MAX_SECONDS", "5"))
+
 RCA_BUCKET = os.getenv("RCA_BUCKET", "")
 RCA_PREFIX = os.getenv("RCA_PREFIX", "rca/")
+RCA_SINK_MODE = os.getenv("RCA_SINK_MODE", "async")
+RCA_SINK_BATCH_SIZE = int(os.getenv("RCA_SINK_BATCH_SIZE", "25"))
+RCA_SINK_FLUSH_SECONDS = float(os.getenv("RCA_SINK_FLUSH_SECONDS", "2"))
+RCA_SINK_GZIP = os.getenv("RCA_SINK_GZIP", "0") == "1"
+RCA_SINK_NDJSON = os.getenv("RCA_SINK_NDJSON", "0") == "1"
+RCA_SINK_MAX_RETRIES = int(os.getenv("RCA_SINK_MAX_RETRIES", "3"))
+RCA_SINK_MAX_REQUEUES = int(os.getenv("RCA_SINK_MAX_REQUEUES", "5"))
+RCA_SINK_BACKOFF_BASE_SECONDS = float(os.getenv("RCA_SINK_BACKOFF_BASE_SECONDS", "0.2"))
+RCA_SINK_BACKOFF_MAX_SECONDS = float(os.getenv("RCA_SINK_BACKOFF_MAX_SECONDS", "5"))
 
 STRANDS_ENABLE_LLM = os.getenv("STRANDS_ENABLE_LLM", "0") == "1"
 
 AGENTCORE_POLICY_ENABLED = os.getenv("AGENTCORE_POLICY_ENABLED", "0") == "1"
 AGENTCORE_POLICY_ENGINE_ID = os.getenv("AGENTCORE_POLICY_ENGINE_ID", "")
 AGENTCORE_POLICY_STRICT = os.getenv("AGENTCORE_POLICY_STRICT", "0") == "1"
+AGENTCORE_POLICY_CACHE_TTL_SECONDS = float(os.getenv("AGENTCORE_POLICY_CACHE_TTL_SECONDS", "300"))
+AGENTCORE_POLICY_CACHE_STALE_SECONDS = float(os.getenv("AGENTCORE_POLICY_CACHE_STALE_SECONDS", "600"))
+AGENTCORE_POLICY_CACHE_ERROR_TTL_SECONDS = float(os.getenv("AGENTCORE_POLICY_CACHE_ERROR_TTL_SECONDS", "30"))
 
 AGENTCORE_EVALUATION_ENABLED = os.getenv("AGENTCORE_EVALUATION_ENABLED", "0") == "1"
 AGENTCORE_EVALUATOR_ID = os.getenv("AGENTCORE_EVALUATOR_ID", "")
 AGENTCORE_EVALUATION_STRICT = os.getenv("AGENTCORE_EVALUATION_STRICT", "0") == "1"
 AGENTCORE_MIN_EVAL_SCORE = float(os.getenv("AGENTCORE_MIN_EVAL_SCORE", "0.7"))
+
+INVESTIGATION_MAX_WORKERS = int(os.getenv("INVESTIGATION_MAX_WORKERS", "8"))
+INVESTIGATION_STEP_TIMEOUT_SECONDS = float(os.getenv("INVESTIGATION_STEP_TIMEOUT_SECONDS", "30"))
+INVESTIGATION_DEADLINE_SECONDS = float(os.getenv("INVESTIGATION_DEADLINE_SECONDS", "60"))
+
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "8"))
+LOG_CONDENSE_ENABLED = os.getenv("LOG_CONDENSE_ENABLED", "1") == "1"
+LOG_CONDENSE_TOP_K = int(os.getenv("LOG_CONDENSE_TOP_K", "10"))
+LOG_CONDENSE_EXEMPLARS = int(os.getenv("LOG_CONDENSE_EXEMPLARS", "3"))
+LOG_CONDENSE_MAX_EXEMPLAR_CHARS = int(os.getenv("LOG_CONDENSE_MAX_EXEMPLAR_CHARS", "500"))
+LOG_CONDENSE_SIMILARITY = float(os.getenv("LOG_CONDENSE_SIMILARITY", "0.5"))
+TRACE_TIMINGS = os.getenv("TRACE_TIMINGS", "0") == "1"
+TRACE_OTEL = os.getenv("TRACE_OTEL", "0") == "1"
+COALESCE_ENABLED = os.getenv("COALESCE_ENABLED", "1") == "1"
+COALESCE_WINDOW_SECONDS = float(os.getenv("COALESCE_WINDOW_SECONDS", "120"))
+COALESCE_WINDOW_SIZE = int(os.getenv("COALESCE_WINDOW_SIZE", "1024"))
+REMEDIATION_BACKEND = os.getenv("REMEDIATION_BACKEND", "memory")
+REMEDIATION_DB_PATH = os.getenv("REMEDIATION_DB_PATH") or os.path.join(
+    tempfile.gettempdir(), "l1agent_remediation.sqlite3"
+)
+REMEDIATION_COOLDOWN_SECONDS = float(os.getenv("REMEDIATION_COOLDOWN_SECONDS", "300"))
+REMEDIATION_LEASE_SECONDS = float(os.getenv("REMEDIATION_LEASE_SECONDS", "900"))
+REMEDIATION_WAIT_SECONDS = float(os.getenv("REMEDIATION_WAIT_SECONDS", "60"))
+REMEDIATION_POLL_SECONDS = float(os.getenv("REMEDIATION_POLL_SECONDS", "1"))
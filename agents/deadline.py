@@ -0,0 +1,141 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from .config import (
+    INCIDENT_LATENCY_BUDGET_SECONDS,
+    LLM_CALL_TIMEOUT_SECONDS,
+    LLM_FALLBACK_RESERVE_SECONDS,
+    LLM_MAX_WORKERS,
+)
+
+T = TypeVar("T")
+
+
+class Deadline:
+    def __init__(self, budget: float) -> None:
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def slice(self, cap: float, reserve: float = 0.0) -> float:
+        return max(0.0, min(cap, self.remaining() - reserve))
+
+
+class LLMTimeout(TimeoutError):
+    def __init__(self, message: str, abandoned: bool) -> None:
+        super().__init__(message)
+        self.abandoned = abandoned
+
+
+class CallCancelled(RuntimeError):
+    pass
+
+
+_deadline: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("incident_deadline", default=None)
+_cancelled: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar("llm_cancelled", default=None)
+_executor = ThreadPoolExecutor(max_workers=max(1, LLM_MAX_WORKERS), thread_name_prefix="llm-call")
+
+
+@contextmanager
+def incident_deadline(budget: float = INCIDENT_LATENCY_BUDGET_SECONDS) -> Iterator[Deadline]:
+    deadline = Deadline(budget)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _deadline.get()
+
+
+def llm_timeout() -> float:
+    deadline = _deadline.get()
+    if deadline is None:
+        return LLM_CALL_TIMEOUT_SECONDS
+    return deadline.slice(LLM_CALL_TIMEOUT_SECONDS, LLM_FALLBACK_RESERVE_SECONDS)
+
+
+def raise_if_cancelled() -> None:
+    event = _cancelled.get()
+    if event is not None and event.is_set():
+        raise CallCancelled("LLM call was cancelled after its deadline")
+
+
+def _submit(fn: Callable[..., T], *args: Any) -> Any:
+    event = threading.Event()
+    ctx = contextvars.copy_context()
+    ctx.run(_cancelled.set, event)
+    return _executor.submit(ctx.run, fn, *args), event
+
+
+def call_with_deadline(fn: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> T:
+    timeout = llm_timeout() if timeout is None else timeout
+    if timeout <= 0:
+        raise LLMTimeout("No latency budget left for LLM call", abandoned=False)
+    future, event = _submit(fn, *args)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        event.set()
+        abandoned = not future.cancel()
+        raise LLMTimeout(f"LLM call exceeded {timeout:.1f}s", abandoned=abandoned) from None
+
+
+def speculate(
+    llm_fn: Callable[[], T],
+    rule_fn: Callable[[], T],
+    accept: Callable[[T], bool],
+    timeout: Optional[float] = None,
+) -> T:
+    timeout = llm_timeout() if timeout is None else timeout
+    if timeout <= 0:
+        return rule_fn()
+    started = time.monotonic()
+    future, event = _submit(llm_fn)
+
+    def _llm_result(wait: float) -> Optional[T]:
+        try:
+            result = future.result(timeout=wait)
+        except Exception:
+            return None
+        return result if accept(result) else None
+
+    def _remaining() -> float:
+        return max(0.0, timeout - (time.monotonic() - started))
+
+    def _abandon() -> None:
+        event.set()
+        future.cancel()
+
+    try:
+        rule_result = rule_fn()
+    except Exception:
+        llm_result = _llm_result(_remaining())
+        if llm_result is None:
+            _abandon()
+            raise
+        return llm_result
+
+    if future.done():
+        llm_result = _llm_result(0)
+        if llm_result is not None:
+            return llm_result
+    if accept(rule_result):
+        _abandon()
+        return rule_result
+    llm_result = _llm_result(_remaining())
+    if llm_result is None:
+        _abandon()
+        return rule_result
+    return llm_result
@@ -64,12 +64,12 @@ def evaluate_workflow(
         if missing_actions:
             issues.append(f"Missing required actions: {', '.join(missing_actions)}")
 
-    text = f"{incident.summary} {incident.details or ''}".lower()
+    access_denied = incident.normalized.keywords.has("access denied")
     if workflow.workflow_id == "emr_spinup_failed":
         emr_ctx = incident.context.get("emr", {}) if isinstance(incident.context, dict) else {}
         if not emr_ctx.get("cluster_id"):
             issues.append("EMR spin-up issue missing context.emr.cluster_id")
-    if "access denied" in text and workflow.auto_retry_allowed:
+    if access_denied and workflow.auto_retry_allowed:
         issues.append("Access-denied pattern detected; avoid automatic retries")
 
     has_validation_errors = any(validation_errors.get(k) for k in validation_errors)
@@ -83,7 +83,7 @@ def evaluate_workflow(
         confidence,
     )
 
-    if "access denied" in text:
+    if access_denied:
         recommended_decision = "escalate"
 
     return {
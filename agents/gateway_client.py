@@ -1,34 +1,129 @@
 ﻿import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from urllib.parse import urljoin
 import requests
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
+from botocore.credentials import ReadOnlyCredentials
 from botocore.session import get_session
-from .config import AWS_REGION
+from requests.adapters import HTTPAdapter
+from .config import (
+    AWS_REGION,
+    GATEWAY_HTTP_BACKOFF_BASE_SECONDS,
+    GATEWAY_HTTP_BACKOFF_MAX_SECONDS,
+    GATEWAY_HTTP_MAX_RETRIES,
+    GATEWAY_HTTP_POOL_SIZE,
+    GATEWAY_HTTP_TIMEOUT_SECONDS,
+)
+
+
+_THROTTLED_STATUS = 429
+_RETRYABLE_STATUS = frozenset({_THROTTLED_STATUS, 500, 502, 503, 504})
+_CREDENTIAL_REFRESH_MARGIN_SECONDS = 60.0
 
 
 class AgentcoreGatewayClient:
-    def __init__(self, base_url: str, region: str = AWS_REGION, service: str = "execute-api") -> None:
+    def __init__(
+        self,
+        base_url: str,
+        region: str = AWS_REGION,
+        service: str = "execute-api",
+        pool_size: int = GATEWAY_HTTP_POOL_SIZE,
+        timeout: float = GATEWAY_HTTP_TIMEOUT_SECONDS,
+        max_retries: int = GATEWAY_HTTP_MAX_RETRIES,
+        backoff_base: float = GATEWAY_HTTP_BACKOFF_BASE_SECONDS,
+        backoff_max: float = GATEWAY_HTTP_BACKOFF_MAX_SECONDS,
+    ) -> None:
         if not base_url:
             raise ValueError("GATEWAY_URL is required")
         self.base_url = base_url.rstrip("/") + "/"
         self.region = region
         self.service = service
         self.session = get_session()
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size, max_retries=0)
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+        self._creds: Optional[ReadOnlyCredentials] = None
+        self._creds_expiry: Optional[float] = None
+        self._creds_lock = threading.Lock()
+
+    def _credentials(self) -> ReadOnlyCredentials:
+        creds = self._creds
+        if creds is not None and (self._creds_expiry is None or time.time() < self._creds_expiry):
+            return creds
+        with self._creds_lock:
+            if self._creds is None or (self._creds_expiry is not None and time.time() >= self._creds_expiry):
+                source = self.session.get_credentials()
+                if source is None:
+                    raise RuntimeError("No AWS credentials available for SigV4 signing")
+                self._creds = source.get_frozen_credentials()
+                expiry = getattr(source, "_expiry_time", None)
+                if isinstance(expiry, datetime):
+                    if expiry.tzinfo is None:
+                        expiry = expiry.replace(tzinfo=timezone.utc)
+                    self._creds_expiry = expiry.timestamp() - _CREDENTIAL_REFRESH_MARGIN_SECONDS
+                else:
+                    self._creds_expiry = None
+            return self._creds
 
     def _sign(self, method: str, url: str, body: str, headers: dict) -> dict:
-        creds = self.session.get_credentials()
-        if creds is None:
-            raise RuntimeError("No AWS credentials available for SigV4 signing")
         req = AWSRequest(method=method, url=url, data=body, headers=headers)
-        SigV4Auth(creds, self.service, self.region).add_auth(req)
+        SigV4Auth(self._credentials(), self.service, self.region).add_auth(req)
         return dict(req.headers)
 
-    def call_tool(self, tool_name: str, payload: dict) -> dict:
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+    def _should_retry(self, status: int, idempotent: bool) -> bool:
+        if status == _THROTTLED_STATUS:
+            return True
+        return idempotent and status in _RETRYABLE_STATUS
+
+    def call_tool(self, tool_name: str, payload: dict, idempotent: bool = True) -> dict:
         url = urljoin(self.base_url, f"tools/{tool_name}")
         body = json.dumps(payload)
         headers = {"content-type": "application/json"}
-        signed_headers = self._sign("POST", url, body, headers)
-        resp = requests.post(url, data=body, headers=signed_headers, timeout=30)
+        attempt = 0
+        while True:
+            signed_headers = self._sign("POST", url, body, headers)
+            resp = self.http.post(url, data=body, headers=signed_headers, timeout=self.timeout)
+            if not self._should_retry(resp.status_code, idempotent) or attempt >= self.max_retries:
+                break
+            resp.close()
+            time.sleep(self._backoff(attempt))
+            attempt += 1
         resp.raise_for_status()
         return resp.json()
+
+    def call_tools_batch(
+        self,
+        calls: Sequence[Tuple[str, dict]],
+        max_workers: Optional[int] = None,
+        idempotent: bool = True,
+    ) -> List[Dict[str, Any]]:
+        if not calls:
+            return []
+        workers = max(1, min(len(calls), max_workers or self.pool_size))
+
+        def _call(call: Tuple[str, dict]) -> Dict[str, Any]:
+            try:
+                return self.call_tool(call[0], call[1], idempotent=idempotent)
+            except Exception as exc:
+                return {"error": str(exc), "tool": call[0]}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_call, calls))
+
+    def close(self) -> None:
+        self.http.close()
@@ -1,6 +1,9 @@
-﻿import json
+﻿import base64
+import json
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from bedrock_agentcore_starter_toolkit.operations.gateway.client import GatewayClient
 from bedrock_agentcore_starter_toolkit.operations.gateway.client import (  # type: ignore
@@ -9,13 +12,19 @@ from bedrock_agentcore_starter_toolkit.operations.gateway.client import (  # typ
 from mcp.client.streamable_http import streamablehttp_client
 from strands.tools.mcp import MCPClient
 
-from .config import GATEWAY_CONFIG_PATH, GATEWAY_URL, GATEWAY_REGION
+from .config import (
+    GATEWAY_CONFIG_PATH,
+    GATEWAY_REGION,
+    GATEWAY_TOKEN_DEFAULT_TTL_SECONDS,
+    GATEWAY_TOKEN_REFRESH_MARGIN_SECONDS,
+    GATEWAY_URL,
+)
 
 
 def load_gateway_config() -> Dict[str, str]:
     path = Path(GATEWAY_CONFIG_PATH)
     if path.exists():
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(path.read_text(encoding="utf-8-sig"))
     return {
         "gateway_url": GATEWAY_URL,
         "region": GATEWAY_REGION,
@@ -26,26 +35,109 @@ def get_gateway_client(config: Dict[str, str]) -> GatewayClient:
     return GatewayClient(region=config.get("region", GATEWAY_REGION))
 
 
-def get_gateway_auth(config: Dict[str, str]) -> Tuple[str, str]:
+def _gateway_url(config: Dict[str, str]) -> str:
     gateway_url = config.get("gateway_url", "")
     if not gateway_url:
         raise ValueError("Gateway URL is required. Set GATEWAY_URL or gateway_config.json")
+    return gateway_url
+
 
+def _fetch_access_token(config: Dict[str, str]) -> str:
     client_info = config.get("client_info")
     if not client_info:
         raise ValueError("client_info is required in gateway_config.json for OAuth")
 
     client_info_obj = client_info if isinstance(client_info, dict) else json.loads(client_info)
     gateway_client = get_gateway_client(config)
-    access_token = get_access_token_for_cognito(gateway_client, client_info_obj)
-    return gateway_url, access_token
+    return get_access_token_for_cognito(gateway_client, client_info_obj)
+
+
+def get_gateway_auth(config: Dict[str, str]) -> Tuple[str, str]:
+    gateway_url = _gateway_url(config)
+    return gateway_url, _fetch_access_token(config)
+
+
+def _token_expiry(token: str, default_ttl: float) -> float:
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return time.time() + default_ttl
+
+
+class GatewayTokenProvider:
+    def __init__(
+        self,
+        config: Dict[str, str],
+        refresh_margin: float = GATEWAY_TOKEN_REFRESH_MARGIN_SECONDS,
+        default_ttl: float = GATEWAY_TOKEN_DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.config = config
+        self.refresh_margin = refresh_margin
+        self.default_ttl = default_ttl
+        self.generation = 0
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def _refresh_locked(self) -> None:
+        token = _fetch_access_token(self.config)
+        self._token = token
+        self._expires_at = _token_expiry(token, self.default_ttl)
+        self.generation += 1
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                if time.time() >= self._expires_at - self.refresh_margin:
+                    self._refresh_locked()
+        except Exception:
+            pass
+        finally:
+            self._refreshing = False
+
+    def stale(self) -> bool:
+        return self._token is None or time.time() >= self._expires_at
+
+    def token(self) -> str:
+        now = time.time()
+        if self._token is None or now >= self._expires_at:
+            with self._lock:
+                if self._token is None or time.time() >= self._expires_at:
+                    self._refresh_locked()
+        elif now >= self._expires_at - self.refresh_margin and not self._refreshing:
+            self._refreshing = True
+            threading.Thread(target=self._background_refresh, name="gateway-token-refresh", daemon=True).start()
+        return self._token or ""
+
+
+_token_provider: Optional[GatewayTokenProvider] = None
+_token_provider_lock = threading.Lock()
+
+
+def get_token_provider() -> GatewayTokenProvider:
+    global _token_provider
+    if _token_provider is None:
+        with _token_provider_lock:
+            if _token_provider is None:
+                _token_provider = GatewayTokenProvider(load_gateway_config())
+    return _token_provider
+
+
+def get_transport_factory(token_provider: Optional[GatewayTokenProvider] = None) -> Callable[[], Any]:
+    provider = token_provider or get_token_provider()
+    gateway_url = _gateway_url(provider.config)
+
+    def _transport() -> Any:
+        return streamablehttp_client(
+            gateway_url,
+            headers={"Authorization": f"Bearer {provider.token()}"},
+        )
+
+    return _transport
 
 
 def get_mcp_client() -> MCPClient:
-    config = load_gateway_config()
-    gateway_url, access_token = get_gateway_auth(config)
-    transport = streamablehttp_client(
-        gateway_url,
-        headers={"Authorization": f"Bearer {access_token}"},
-    )
-    return MCPClient(transport)
+    return MCPClient(get_transport_factory())
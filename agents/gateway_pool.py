@@ -0,0 +1,155 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from strands.tools.mcp import MCPClient
+
+from .config import (
+    GATEWAY_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    GATEWAY_POOL_SIZE,
+    GATEWAY_SESSION_IDLE_CHECK_SECONDS,
+)
+from .gateway_mcp import GatewayTokenProvider, get_token_provider, get_transport_factory
+
+T = TypeVar("T")
+
+
+class _PooledSession:
+    __slots__ = ("client", "generation", "last_used")
+
+    def __init__(self, client: MCPClient, generation: int) -> None:
+        self.client = client
+        self.generation = generation
+        self.last_used = time.monotonic()
+
+
+class GatewaySessionPool:
+    def __init__(
+        self,
+        token_provider: GatewayTokenProvider,
+        size: int = GATEWAY_POOL_SIZE,
+        idle_check_seconds: float = GATEWAY_SESSION_IDLE_CHECK_SECONDS,
+        acquire_timeout: float = GATEWAY_POOL_ACQUIRE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.token_provider = token_provider
+        self.size = max(1, size)
+        self.idle_check_seconds = idle_check_seconds
+        self.acquire_timeout = acquire_timeout
+        self._transport_factory = get_transport_factory(token_provider)
+        self._idle: "queue.LifoQueue[_PooledSession]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._counters = {"opened": 0, "closed": 0, "rotated": 0, "health_failures": 0, "reconnects": 0}
+        self._counter_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._counter_lock:
+            self._counters[key] += 1
+
+    def _open(self) -> _PooledSession:
+        self.token_provider.token()
+        generation = self.token_provider.generation
+        client = MCPClient(self._transport_factory)
+        client.start()
+        self._count("opened")
+        return _PooledSession(client, generation)
+
+    def _close(self, session: _PooledSession) -> None:
+        try:
+            session.client.stop(None, None, None)
+        except Exception:
+            pass
+        self._count("closed")
+
+    def _usable(self, session: _PooledSession) -> bool:
+        self.token_provider.token()
+        if session.generation != self.token_provider.generation:
+            self._count("rotated")
+            return False
+        if time.monotonic() - session.last_used >= self.idle_check_seconds:
+            try:
+                session.client.list_tools_sync()
+            except Exception:
+                self._count("health_failures")
+                return False
+        return True
+
+    def _acquire(self) -> _PooledSession:
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No gateway session available within {self.acquire_timeout:.1f}s")
+        try:
+            while True:
+                try:
+                    session = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._open()
+                if self._usable(session):
+                    return session
+                self._close(session)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, session: _PooledSession, broken: bool) -> None:
+        if broken:
+            self._close(session)
+        else:
+            session.last_used = time.monotonic()
+            self._idle.put(session)
+        self._slots.release()
+
+    def run(self, fn: Callable[[MCPClient], T], retry: bool = True) -> T:
+        session = self._acquire()
+        try:
+            result = fn(session.client)
+        except Exception:
+            self._release(session, broken=True)
+            if not retry:
+                raise
+            self._count("reconnects")
+            session = self._acquire()
+            try:
+                result = fn(session.client)
+            except Exception:
+                self._release(session, broken=True)
+                raise
+        self._release(session, broken=False)
+        return result
+
+    @contextmanager
+    def lease(self) -> Iterator[MCPClient]:
+        session = self._acquire()
+        try:
+            yield session.client
+        except BaseException:
+            self._release(session, broken=True)
+            raise
+        self._release(session, broken=False)
+
+    def close(self) -> None:
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(session)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._counter_lock:
+            stats: Dict[str, Any] = dict(self._counters)
+        stats.update({"size": self.size, "idle": self._idle.qsize(), "token_generation": self.token_provider.generation})
+        return stats
+
+
+_pool: Optional[GatewaySessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> GatewaySessionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = GatewaySessionPool(get_token_provider())
+    return _pool
@@ -1,9 +1,23 @@
 ﻿import json
-from typing import Any
+from typing import Any, Dict, Optional
 from .schemas import Incident, IntentResult
-from .config import STRANDS_ENABLE_LLM
-from .agent_factory import build_agent
+from .cache import MinHashIndex, TTLCache
+from .config import (
+    INTENT_CACHE_SIMILARITY_THRESHOLD,
+    INTENT_CACHE_SIZE,
+    INTENT_CACHE_TTL_SECONDS,
+    LLM_SPECULATIVE,
+    STRANDS_ENABLE_LLM,
+)
+from .agent_factory import agent_session
+from .deadline import call_with_deadline, speculate
 from .prompts import INTENT_CLASSIFIER_PROMPT
+from .tracing import traced
+from .keywords import ACCESS_REQUEST_TERMS, PROD_TERMS, REQUEST_TERMS, KeywordMatches
+
+
+_intent_cache = TTLCache(INTENT_CACHE_SIZE, INTENT_CACHE_TTL_SECONDS)
+_similar_intents = MinHashIndex(INTENT_CACHE_SIMILARITY_THRESHOLD, INTENT_CACHE_SIZE)
 
 
 INTENTS = [
@@ -24,50 +38,33 @@ INTENTS = [
 
 
 def is_non_incident_access_request(incident: Incident) -> bool:
-    text = f"{incident.summary} {incident.details or ''}".lower()
-    access_terms = (
-        "access to prod",
-        "production access",
-        "prod access",
-        "grant access",
-        "request access",
-        "need access",
-        "prod credentials",
-        "permission to prod",
-    )
-    request_terms = (
-        "request",
-        "grant",
-        "need",
-        "please provide",
-        "please give",
-    )
-    return any(term in text for term in access_terms) or (
-        ("prod" in text or "production" in text) and any(term in text for term in request_terms) and "access" in text
+    matches = incident.normalized.keywords
+    return matches.any(ACCESS_REQUEST_TERMS) or (
+        matches.any(PROD_TERMS) and matches.any(REQUEST_TERMS) and matches.has("access")
     )
 
 
-def _rule_based_intent(text: str) -> IntentResult:
-    t = text.lower()
-    if "alarm" in t and ("dag" in t or "mwaa" in t or "airflow" in t):
+def _rule_based_intent(matches: KeywordMatches) -> IntentResult:
+    m = matches
+    if m.has("alarm") and m.any(("dag", "mwaa", "airflow")):
         return IntentResult(intent="dag_alarm", confidence=0.6, rationale="Matched alarm for dag/mwaa")
-    if "mwaa" in t or "airflow" in t or "dag" in t:
+    if m.any(("mwaa", "airflow", "dag")):
         return IntentResult(intent="mwaa_failure", confidence=0.6, rationale="Matched keyword dag/mwaa/airflow")
-    if "glue" in t or "etl" in t:
+    if m.any(("glue", "etl")):
         return IntentResult(intent="glue_etl_failure", confidence=0.6, rationale="Matched keyword glue/etl")
-    if "athena" in t:
+    if m.has("athena"):
         return IntentResult(intent="athena_failure", confidence=0.6, rationale="Matched keyword athena")
-    if "emr" in t:
+    if m.has("emr"):
         return IntentResult(intent="emr_failure", confidence=0.6, rationale="Matched keyword emr")
-    if "kafka" in t or "msk" in t:
+    if m.any(("kafka", "msk")):
         return IntentResult(intent="kafka_events_failed", confidence=0.6, rationale="Matched keyword kafka/msk")
-    if "access denied" in t or "permission" in t:
+    if m.any(("access denied", "permission")):
         return IntentResult(intent="access_denied", confidence=0.6, rationale="Matched access denied")
-    if "zero" in t or "no data" in t:
+    if m.any(("zero", "no data")):
         return IntentResult(intent="source_zero_data", confidence=0.6, rationale="Matched zero/no data")
-    if "missing" in t or "not available" in t or "cmcm" in t:
+    if m.any(("missing", "not available", "cmcm")):
         return IntentResult(intent="data_missing", confidence=0.6, rationale="Matched missing data")
-    if "recovery" in t or "auto recover" in t:
+    if m.any(("recovery", "auto recover")):
         return IntentResult(intent="batch_auto_recovery_failed", confidence=0.6, rationale="Matched recovery failure")
     return IntentResult(intent="unknown", confidence=0.3, rationale="No match")
 
@@ -79,14 +76,46 @@ def _parse_llm_result(result: Any) -> IntentResult:
     return IntentResult(**data)
 
 
+@traced("llm.intent")
 def _llm_intent(text: str) -> IntentResult:
-    agent = build_agent(INTENT_CLASSIFIER_PROMPT)
-    result = agent(text)
+    with agent_session(INTENT_CLASSIFIER_PROMPT) as agent:
+        result = agent(text)
     return _parse_llm_result(result)
 
 
+def _cached_intent(incident: Incident) -> Optional[IntentResult]:
+    cached = _intent_cache.get(incident.normalized.fingerprint)
+    note = "cache_hit: exact fingerprint"
+    if cached is None:
+        similar = _similar_intents.query(incident.normalized.stable_tokens)
+        if similar is None:
+            return None
+        cached = _intent_cache.get(similar[0])
+        if cached is None:
+            return None
+        note = f"cache_hit: similar fingerprint {similar[1]:.2f}"
+    return cached.model_copy(update={"rationale": f"{cached.rationale} [{note}]"})
+
+
+def _llm_intent_cached(incident: Incident, text: str) -> IntentResult:
+    result = _llm_intent(text)
+    fingerprint = incident.normalized.fingerprint
+    _intent_cache.set(fingerprint, result.model_copy())
+    _similar_intents.add(fingerprint, incident.normalized.stable_tokens)
+    return result
+
+
+def intent_cache_stats() -> Dict[str, Any]:
+    return _intent_cache.stats()
+
+
+def clear_intent_cache() -> None:
+    _intent_cache.clear()
+    _similar_intents.clear()
+
+
 def classify_intent(incident: Incident, force_rule_based: bool = False) -> IntentResult:
-    text = f"{incident.summary} {incident.details or ''}".strip()
+    text = incident.normalized.raw.strip()
     if is_non_incident_access_request(incident):
         return IntentResult(
             intent="access_denied",
@@ -95,9 +124,20 @@ def classify_intent(incident: Incident, force_rule_based: bool = False) -> Inten
         )
 
     if force_rule_based or not STRANDS_ENABLE_LLM:
-        return _rule_based_intent(text)
+        return _rule_based_intent(incident.normalized.keywords)
+
+    cached = _cached_intent(incident)
+    if cached is not None:
+        return cached
+
+    if LLM_SPECULATIVE:
+        return speculate(
+            lambda: _llm_intent_cached(incident, text),
+            lambda: _rule_based_intent(incident.normalized.keywords),
+            accept=lambda result: result.intent != "unknown",
+        )
 
     try:
-        return _llm_intent(text)
+        return call_with_deadline(_llm_intent_cached, incident, text)
     except Exception:
-        return _rule_based_intent(text)
+        return _rule_based_intent(incident.normalized.keywords)
@@ -1,16 +1,40 @@
+import asyncio
+import contextvars
 import json
-from typing import Dict, Any
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 
 from .schemas import Incident, InvestigationResult
-from .config import STRANDS_ENABLE_LLM
-from .agent_factory import build_agent
+from .config import (
+    INVESTIGATION_DEADLINE_SECONDS,
+    INVESTIGATION_MAX_WORKERS,
+    INVESTIGATION_STEP_TIMEOUT_SECONDS,
+    STRANDS_ENABLE_LLM,
+)
+from .agent_factory import agent_session
+from .deadline import call_with_deadline
+from .log_condense import condense_log_evidence
 from .prompts import INVESTIGATOR_PROMPT
-from .mcp_tools import call_gateway_tool, list_gateway_tools, search_gateway_tools
-from .tool_registry import resolve_tool_name
-from .workflows import InvestigationStep, select_workflow
+from .tracing import span, traced
+from .mcp_tools import (
+    acall_gateway_tool,
+    asearch_gateway_tools,
+    call_gateway_tool,
+    leased_gateway_tools,
+    search_gateway_tools,
+)
+from .tool_registry import lookup_tool_name, resolve_tool_name
+from .workflows import WORKFLOWS, InvestigationStep, select_workflow
+
+
+StepCallback = Callable[[str, Any, bool], None]
 
 
 def _search_tool(preferred_suffix: str, query: str) -> str:
+    known = lookup_tool_name(preferred_suffix)
+    if known:
+        return known
     try:
         names = search_gateway_tools(query)
         for name in names:
@@ -23,35 +47,216 @@ def _search_tool(preferred_suffix: str, query: str) -> str:
     return resolve_tool_name(preferred_suffix)
 
 
+async def _asearch_tool(preferred_suffix: str, query: str) -> str:
+    known = lookup_tool_name(preferred_suffix)
+    if known:
+        return known
+    try:
+        names = await asearch_gateway_tools(query)
+        for name in names:
+            if preferred_suffix in name:
+                return name
+        if names:
+            return names[0]
+    except Exception:
+        pass
+    return resolve_tool_name(preferred_suffix)
+
+
+def prewarm_tool_search() -> List[str]:
+    failed: List[str] = []
+    queries = {step.query for workflow in WORKFLOWS.values() for step in workflow.investigation_steps}
+    for query in sorted(queries):
+        try:
+            search_gateway_tools(query)
+        except Exception:
+            failed.append(query)
+    return failed
+
+
 def _run_step(incident: Incident, step: InvestigationStep) -> Dict[str, Any]:
     ctx = incident.context.get(step.context_key, {}) if step.context_key else {}
-    tool = _search_tool(step.tool_suffix, step.query)
-    return call_gateway_tool(tool, ctx)
+    with span("investigate.step", evidence_key=step.evidence_key):
+        tool = _search_tool(step.tool_suffix, step.query)
+        return condense_log_evidence(call_gateway_tool(tool, ctx))
+
+
+async def _arun_step(incident: Incident, step: InvestigationStep) -> Dict[str, Any]:
+    ctx = incident.context.get(step.context_key, {}) if step.context_key else {}
+    with span("investigate.step", evidence_key=step.evidence_key):
+        tool = await _asearch_tool(step.tool_suffix, step.query)
+        return condense_log_evidence(await acall_gateway_tool(tool, ctx))
+
+
+def _should_skip(incident: Incident, step: InvestigationStep) -> bool:
+    ctx = incident.context.get(step.context_key, {}) if step.context_key else {}
+    return bool(step.context_key and not ctx and step.optional)
+
 
+def _run_steps(
+    incident: Incident,
+    steps: List[InvestigationStep],
+    step_timeout: float,
+    deadline: float,
+    on_step: Optional[StepCallback] = None,
+) -> Tuple[Dict[str, Any], Set[str]]:
+    results: Dict[str, Any] = {}
+    failed: Set[str] = set()
+    if not steps:
+        return results, failed
 
-def _rule_based(incident: Incident, intent: str) -> InvestigationResult:
+    deadline_at = time.monotonic() + deadline
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(len(steps), INVESTIGATION_MAX_WORKERS)),
+        thread_name_prefix="investigation-step",
+    )
+    try:
+        pending = {
+            executor.submit(contextvars.copy_context().run, _run_step, incident, step): step for step in steps
+        }
+        cutoff = min(time.monotonic() + step_timeout, deadline_at)
+        while pending:
+            done, _ = wait(pending, timeout=max(0.0, cutoff - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                step = pending.pop(future)
+                try:
+                    results[step.evidence_key] = future.result()
+                except Exception as exc:
+                    results[step.evidence_key] = {"error": str(exc)}
+                    failed.add(step.evidence_key)
+                if on_step is not None:
+                    on_step(step.evidence_key, results[step.evidence_key], step.evidence_key in failed)
+
+        if cutoff >= deadline_at:
+            message = f"Investigation deadline of {deadline:.1f}s exceeded"
+        else:
+            message = f"Step timed out after {step_timeout:.1f}s"
+        for future, step in pending.items():
+            future.cancel()
+            results[step.evidence_key] = {"error": message, "timed_out": True}
+            failed.add(step.evidence_key)
+            if on_step is not None:
+                on_step(step.evidence_key, results[step.evidence_key], True)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results, failed
+
+
+async def _arun_steps(
+    incident: Incident,
+    steps: List[InvestigationStep],
+    step_timeout: float,
+    deadline: float,
+    on_step: Optional[StepCallback] = None,
+) -> Tuple[Dict[str, Any], Set[str]]:
+    results: Dict[str, Any] = {}
+    failed: Set[str] = set()
+    if not steps:
+        return results, failed
+
+    loop = asyncio.get_running_loop()
+    deadline_at = loop.time() + deadline
+    pending = {
+        asyncio.ensure_future(asyncio.wait_for(_arun_step(incident, step), timeout=step_timeout)): step
+        for step in steps
+    }
+    while pending:
+        remaining = deadline_at - loop.time()
+        if remaining <= 0:
+            break
+        done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            step = pending.pop(task)
+            exc = task.exception()
+            if isinstance(exc, asyncio.TimeoutError):
+                results[step.evidence_key] = {"error": f"Step timed out after {step_timeout:.1f}s", "timed_out": True}
+                failed.add(step.evidence_key)
+            elif exc is not None:
+                results[step.evidence_key] = {"error": str(exc)}
+                failed.add(step.evidence_key)
+            else:
+                results[step.evidence_key] = task.result()
+            if on_step is not None:
+                on_step(step.evidence_key, results[step.evidence_key], step.evidence_key in failed)
+
+    for task, step in pending.items():
+        task.cancel()
+        results[step.evidence_key] = {
+            "error": f"Investigation deadline of {deadline:.1f}s exceeded",
+            "timed_out": True,
+        }
+        failed.add(step.evidence_key)
+        if on_step is not None:
+            on_step(step.evidence_key, results[step.evidence_key], True)
+
+    return results, failed
+
+
+def _prepare(incident: Incident, intent: str) -> Tuple[Dict[str, Any], List[InvestigationStep]]:
     workflow = select_workflow(intent, incident)
     evidence: Dict[str, Any] = {
         "intent": intent,
         "workflow_id": workflow.workflow_id,
         "service": workflow.service,
     }
+    steps = [step for step in workflow.investigation_steps if not _should_skip(incident, step)]
+    return evidence, steps
 
-    for step in workflow.investigation_steps:
-        ctx = incident.context.get(step.context_key, {}) if step.context_key else {}
-        if step.context_key and not ctx and step.optional:
-            continue
 
-        try:
-            evidence[step.evidence_key] = _run_step(incident, step)
-        except Exception as exc:
-            evidence[step.evidence_key] = {"error": str(exc)}
-            if not step.optional:
-                evidence.setdefault("step_errors", []).append(step.evidence_key)
+def _collect_evidence(
+    intent: str,
+    evidence: Dict[str, Any],
+    steps: List[InvestigationStep],
+    results: Dict[str, Any],
+    failed: Set[str],
+) -> InvestigationResult:
+    for step in steps:
+        evidence[step.evidence_key] = results[step.evidence_key]
+        if step.evidence_key in failed and not step.optional:
+            evidence.setdefault("step_errors", []).append(step.evidence_key)
 
     return InvestigationResult(intent=intent, evidence=evidence)
 
 
+def _rule_based(
+    incident: Incident,
+    intent: str,
+    step_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    on_step: Optional[StepCallback] = None,
+) -> InvestigationResult:
+    evidence, steps = _prepare(incident, intent)
+    results, failed = _run_steps(
+        incident,
+        steps,
+        step_timeout=INVESTIGATION_STEP_TIMEOUT_SECONDS if step_timeout is None else step_timeout,
+        deadline=INVESTIGATION_DEADLINE_SECONDS if deadline is None else deadline,
+        on_step=on_step,
+    )
+    return _collect_evidence(intent, evidence, steps, results, failed)
+
+
+async def _arule_based(
+    incident: Incident,
+    intent: str,
+    step_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    on_step: Optional[StepCallback] = None,
+) -> InvestigationResult:
+    evidence, steps = _prepare(incident, intent)
+    results, failed = await _arun_steps(
+        incident,
+        steps,
+        step_timeout=INVESTIGATION_STEP_TIMEOUT_SECONDS if step_timeout is None else step_timeout,
+        deadline=INVESTIGATION_DEADLINE_SECONDS if deadline is None else deadline,
+        on_step=on_step,
+    )
+    return _collect_evidence(intent, evidence, steps, results, failed)
+
+
 def _parse_llm_result(result: Any) -> InvestigationResult:
     if isinstance(result, dict):
         return InvestigationResult(**result)
@@ -59,21 +264,41 @@ def _parse_llm_result(result: Any) -> InvestigationResult:
     return InvestigationResult(**data)
 
 
+@traced("llm.investigate")
 def _llm_investigate(incident: Incident, intent: str) -> InvestigationResult:
-    tools = list_gateway_tools()
-    agent = build_agent(INVESTIGATOR_PROMPT, tools=tools)
     payload = incident.model_dump()
     payload["intent"] = intent
     payload["workflow_id"] = select_workflow(intent, incident).workflow_id
-    result = agent(json.dumps(payload))
+    with leased_gateway_tools() as tools, agent_session(INVESTIGATOR_PROMPT, tools=tools) as agent:
+        result = agent(json.dumps(payload))
     return _parse_llm_result(result)
 
 
-def investigate(incident: Incident, intent: str, force_rule_based: bool = False) -> InvestigationResult:
+def investigate(
+    incident: Incident,
+    intent: str,
+    force_rule_based: bool = False,
+    on_step: Optional[StepCallback] = None,
+) -> InvestigationResult:
+    if force_rule_based or not STRANDS_ENABLE_LLM:
+        return _rule_based(incident, intent, on_step=on_step)
+
+    try:
+        return call_with_deadline(_llm_investigate, incident, intent)
+    except Exception:
+        return _rule_based(incident, intent, on_step=on_step)
+
+
+async def ainvestigate(
+    incident: Incident,
+    intent: str,
+    force_rule_based: bool = False,
+    on_step: Optional[StepCallback] = None,
+) -> InvestigationResult:
     if force_rule_based or not STRANDS_ENABLE_LLM:
-        return _rule_based(incident, intent)
+        return await _arule_based(incident, intent, on_step=on_step)
 
     try:
-        return _llm_investigate(incident, intent)
+        return await asyncio.to_thread(call_with_deadline, _llm_investigate, incident, intent)
     except Exception:
-        return _rule_based(incident, intent)
+        return await _arule_based(incident, intent, on_step=on_step)
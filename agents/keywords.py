@@ -0,0 +1,180 @@
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+
+ACCESS_REQUEST_TERMS = (
+    "access to prod",
+    "production access",
+    "prod access",
+    "grant access",
+    "request access",
+    "need access",
+    "prod credentials",
+    "permission to prod",
+)
+
+REQUEST_TERMS = (
+    "request",
+    "grant",
+    "need",
+    "please provide",
+    "please give",
+)
+
+PROD_TERMS = ("prod", "production")
+
+INTENT_TERMS = (
+    "alarm",
+    "dag",
+    "mwaa",
+    "airflow",
+    "glue",
+    "etl",
+    "athena",
+    "emr",
+    "kafka",
+    "msk",
+    "access denied",
+    "permission",
+    "zero",
+    "no data",
+    "missing",
+    "not available",
+    "cmcm",
+    "recovery",
+    "auto recover",
+)
+
+EMR_SPINUP_TERMS = ("spin", "bootstrap", "provision", "cluster launch")
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+
+_VOLATILE_PATTERNS = (
+    (re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"), " _id_ "),
+    (
+        re.compile(r"\d{4}-\d{2}-\d{2}(?:[t ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:z|[+-]\d{2}:?\d{2})?)?"),
+        " _ts_ ",
+    ),
+    (re.compile(r"\b\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?\b"), " _ts_ "),
+    (re.compile(r"\b([a-z_][a-z0-9_]*)=[^\s/,;&]+"), r" \1 _val_ "),
+)
+
+
+def _stable_part(part: str) -> str:
+    if part.isdigit():
+        return "_n_"
+    if len(part) >= 5 and any(char.isdigit() for char in part):
+        return "_id_"
+    return part
+
+
+def _stable_token(token: str) -> str:
+    if "_" not in token:
+        return _stable_part(token)
+    return "_".join(_stable_part(part) if part else part for part in token.split("_"))
+
+
+ALL_TERMS = tuple(
+    sorted(set(ACCESS_REQUEST_TERMS + REQUEST_TERMS + PROD_TERMS + ("access",) + INTENT_TERMS + EMR_SPINUP_TERMS))
+)
+
+
+class KeywordMatches:
+    __slots__ = ("matches", "terms")
+
+    def __init__(self, matches: List[Tuple[str, int]]) -> None:
+        self.matches = matches
+        self.terms: FrozenSet[str] = frozenset(term for term, _ in matches)
+
+    def has(self, term: str) -> bool:
+        return term in self.terms
+
+    def any(self, terms: Iterable[str]) -> bool:
+        return not self.terms.isdisjoint(terms)
+
+    def positions(self, term: str) -> List[int]:
+        return [pos for matched, pos in self.matches if matched == term]
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    terminal = "" in node
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        return "(?:" + body + ")?"
+    return body
+
+
+class KeywordMatcher:
+    def __init__(self, terms: Iterable[str]) -> None:
+        self.terms = tuple(sorted(set(terms)))
+        trie: Dict[str, Any] = {}
+        for term in self.terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self._pattern = re.compile(_trie_pattern(trie))
+        self._prefixes = {term: tuple(p for p in self.terms if term.startswith(p)) for term in self.terms}
+
+    def scan(self, text: str) -> KeywordMatches:
+        found: List[Tuple[str, int]] = []
+        search = self._pattern.search
+        pos = 0
+        while True:
+            match = search(text, pos)
+            if match is None:
+                break
+            start = match.start()
+            found.extend((term, start) for term in self._prefixes[match.group()])
+            pos = start + 1
+        return KeywordMatches(found)
+
+
+MATCHER = KeywordMatcher(ALL_TERMS)
+
+
+def scan_text(text: str) -> KeywordMatches:
+    return MATCHER.scan(text.lower())
+
+
+class NormalizedText:
+    def __init__(self, raw: str) -> None:
+        self.raw = raw
+        self._lower: Optional[str] = None
+        self._tokens: Optional[FrozenSet[str]] = None
+        self._keywords: Optional[KeywordMatches] = None
+        self._stable_tokens: Optional[Tuple[str, ...]] = None
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.raw.lower()
+        return self._lower
+
+    @property
+    def tokens(self) -> FrozenSet[str]:
+        if self._tokens is None:
+            self._tokens = frozenset(_TOKEN_RE.findall(self.lower))
+        return self._tokens
+
+    @property
+    def keywords(self) -> KeywordMatches:
+        if self._keywords is None:
+            self._keywords = MATCHER.scan(self.lower)
+        return self._keywords
+
+    @property
+    def stable_tokens(self) -> Tuple[str, ...]:
+        if self._stable_tokens is None:
+            text = self.lower
+            for pattern, replacement in _VOLATILE_PATTERNS:
+                text = pattern.sub(replacement, text)
+            self._stable_tokens = tuple(_stable_token(token) for token in _TOKEN_RE.findall(text))
+        return self._stable_tokens
+
+    @property
+    def fingerprint(self) -> str:
+        return " ".join(self.stable_tokens)
@@ -0,0 +1,228 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import (
+    LOG_CONDENSE_ENABLED,
+    LOG_CONDENSE_EXEMPLARS,
+    LOG_CONDENSE_MAX_EXEMPLAR_CHARS,
+    LOG_CONDENSE_SIMILARITY,
+    LOG_CONDENSE_TOP_K,
+)
+from .mcp_tools import unwrap_tool_result
+from .service_policy_pack import ACCESS_DENIED_TERMS
+
+WILDCARD = "<*>"
+
+_MASKS = (
+    ("ARN", r"\barn:aws[\w-]*:[^\s\"',]+"),
+    ("URI", r"\b(?:s3a?|hdfs|file)://[^\s\"',]+"),
+    ("URL", r"https?://[^\s\"',]+"),
+    ("UUID", r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"),
+    ("TS", r"\b\d{4}[-/]\d{2}[-/]\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"),
+    ("CLOCK", r"\b\d{1,2}:\d{2}:\d{2}(?:[.,]\d+)?\b"),
+    ("IP", r"\b\d{1,3}(?:\.\d{1,3}){3}(?::\d+)?\b"),
+    ("PATH", r"(?<![\w.])(?:/[\w.@-]+){2,}/?"),
+    ("HEX", r"\b(?:0x)?[0-9a-fA-F]{12,}\b"),
+    ("ID", r"\b[A-Za-z]+(?:[_-][A-Za-z]+)*[_-]\d[\w-]*\b|\b(?=[A-Za-z_]*\d)(?=\d*[A-Za-z])\w{6,}\b"),
+    ("NUM", r"(?<![\w.])[-+]?\d+(?:\.\d+)?(?![\w.])"),
+)
+_MASK_RE = re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern in _MASKS))
+_MASK_LABELS = {"CLOCK": "<TS>"}
+_MASKABLE = re.compile(r"[\d/:]")
+_MASK_CACHE_SIZE = 65536
+_mask_cache: Dict[str, str] = {}
+
+_ACCESS_DENIED_RE = re.compile("|".join(re.escape(term) for term in ACCESS_DENIED_TERMS), re.IGNORECASE)
+_ERROR_RE = re.compile(
+    r"\b(error|exception|fatal|fail(?:ed|ure)?|traceback|denied|unauthori[sz]ed|timed? ?out|killed|oom)\b|"
+    + _ACCESS_DENIED_RE.pattern,
+    re.IGNORECASE,
+)
+_WARN_RE = re.compile(r"\bwarn(?:ing)?\b", re.IGNORECASE)
+
+
+def _mask(match: "re.Match[str]") -> str:
+    name = match.lastgroup or "NUM"
+    return _MASK_LABELS.get(name) or f"<{name}>"
+
+
+def _mask_token(token: str) -> str:
+    masked = _mask_cache.get(token)
+    if masked is None:
+        masked = _MASK_RE.sub(_mask, token) if _MASKABLE.search(token) else token
+        if len(_mask_cache) < _MASK_CACHE_SIZE:
+            _mask_cache[token] = masked
+    return masked
+
+
+def mask_tokens(message: str) -> List[str]:
+    return [_mask_token(token) for token in message.split()]
+
+
+def mask_message(message: str) -> str:
+    return " ".join(mask_tokens(message))
+
+
+def message_level(message: str) -> str:
+    if _ERROR_RE.search(message):
+        return "error"
+    if _WARN_RE.search(message):
+        return "warn"
+    return "info"
+
+
+class _Cluster:
+    __slots__ = ("template", "count", "level", "first", "last", "exemplars", "access_denied")
+
+    def __init__(self, tokens: List[str], level: str) -> None:
+        self.template = tokens
+        self.count = 0
+        self.level = level
+        self.first: Optional[int] = None
+        self.last: Optional[int] = None
+        self.exemplars: List[str] = []
+        self.access_denied = False
+
+    def similarity(self, tokens: Sequence[str]) -> Tuple[float, int]:
+        same = 0
+        wildcards = 0
+        for left, right in zip(self.template, tokens):
+            if left == WILDCARD:
+                wildcards += 1
+            elif left == right:
+                same += 1
+        return same / len(tokens), wildcards
+
+    def merge(self, tokens: Sequence[str]) -> None:
+        self.template = [left if left == right else WILDCARD for left, right in zip(self.template, tokens)]
+
+
+class TemplateMiner:
+    def __init__(
+        self,
+        similarity: float = LOG_CONDENSE_SIMILARITY,
+        depth: int = 2,
+        max_children: int = 64,
+        max_exemplars: int = LOG_CONDENSE_EXEMPLARS,
+    ) -> None:
+        self.similarity = similarity
+        self.depth = depth
+        self.max_children = max_children
+        self.max_exemplars = max_exemplars
+        self._tree: Dict[int, Dict[Tuple[str, ...], List[_Cluster]]] = {}
+        self.clusters: List[_Cluster] = []
+
+    def _prefix(self, tokens: Sequence[str]) -> Tuple[str, ...]:
+        prefix = []
+        for token in tokens[: self.depth]:
+            prefix.append(WILDCARD if any(char.isdigit() for char in token) or token.startswith("<") else token)
+        return tuple(prefix)
+
+    def _group(self, tokens: Sequence[str]) -> List[_Cluster]:
+        by_prefix = self._tree.setdefault(len(tokens), {})
+        prefix = self._prefix(tokens)
+        group = by_prefix.get(prefix)
+        if group is None:
+            if len(by_prefix) >= self.max_children:
+                prefix = (WILDCARD,) * len(prefix)
+            group = by_prefix.setdefault(prefix, [])
+        return group
+
+    def add(self, message: str, timestamp: Optional[int] = None) -> _Cluster:
+        tokens = mask_tokens(message) or [""]
+        group = self._group(tokens)
+        best: Optional[_Cluster] = None
+        best_score = (-1.0, -1)
+        for cluster in group:
+            score = cluster.similarity(tokens)
+            if score > best_score:
+                best, best_score = cluster, score
+        if best is None or best_score[0] < self.similarity:
+            best = _Cluster(list(tokens), message_level(message))
+            group.append(best)
+            self.clusters.append(best)
+        else:
+            best.merge(tokens)
+            if best.level != "error":
+                level = message_level(message)
+                if level == "error" or (level == "warn" and best.level == "info"):
+                    best.level = level
+        best.count += 1
+        if timestamp is not None:
+            best.first = timestamp if best.first is None else min(best.first, timestamp)
+            best.last = timestamp if best.last is None else max(best.last, timestamp)
+        if _ACCESS_DENIED_RE.search(message) and not best.access_denied:
+            best.access_denied = True
+            if message not in best.exemplars:
+                best.exemplars = [message] + best.exemplars[: max(0, self.max_exemplars - 1)]
+        elif len(best.exemplars) < self.max_exemplars and message not in best.exemplars:
+            best.exemplars.append(message)
+        return best
+
+
+_LEVEL_RANK = {"error": 0, "warn": 1, "info": 2}
+
+
+def _clip(message: str) -> str:
+    limit = LOG_CONDENSE_MAX_EXEMPLAR_CHARS
+    if len(message) <= limit:
+        return message
+    match = _ACCESS_DENIED_RE.search(message)
+    if match is not None and match.end() > limit:
+        start = max(0, match.start() - limit // 2)
+        return "..." + message[start : start + limit] + "..."
+    return message[:limit] + "..."
+
+
+def condense_events(events: Sequence[Dict[str, Any]], top_k: int = LOG_CONDENSE_TOP_K) -> Dict[str, Any]:
+    miner = TemplateMiner()
+    for event in events:
+        message = event.get("message")
+        if isinstance(message, str):
+            miner.add(message.strip(), event.get("timestamp"))
+
+    ranked = sorted(
+        miner.clusters,
+        key=lambda cluster: (not cluster.access_denied, _LEVEL_RANK[cluster.level], -cluster.count),
+    )
+    kept = [cluster for index, cluster in enumerate(ranked) if cluster.access_denied or index < top_k]
+    signatures = []
+    for cluster in kept:
+        signature = {
+            "template": " ".join(cluster.template),
+            "level": cluster.level,
+            "count": cluster.count,
+            "first_timestamp": cluster.first,
+            "last_timestamp": cluster.last,
+            "exemplars": [_clip(message) for message in cluster.exemplars],
+        }
+        if cluster.access_denied:
+            signature["access_denied"] = True
+        signatures.append(signature)
+    return {
+        "event_count": len(events),
+        "template_count": len(miner.clusters),
+        "error_count": sum(cluster.count for cluster in miner.clusters if cluster.level == "error"),
+        "access_denied": any(cluster.access_denied for cluster in miner.clusters),
+        "omitted_events": sum(cluster.count for cluster in ranked[len(kept) :]),
+        "signatures": signatures,
+    }
+
+
+def _is_log_events(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(item, dict) and isinstance(item.get("message"), str) for item in value)
+    )
+
+
+def condense_log_evidence(result: Any) -> Any:
+    if not LOG_CONDENSE_ENABLED:
+        return result
+    payload = unwrap_tool_result(result)
+    if not isinstance(payload, dict) or not _is_log_events(payload.get("events")):
+        return result
+    condensed = {key: value for key, value in payload.items() if key != "events"}
+    condensed["condensed"] = condense_events(payload["events"])
+    return condensed
@@ -1,8 +1,17 @@
 ﻿import argparse
 import json
 import sys
+import threading
 from bedrock_agentcore import BedrockAgentCoreApp
-from .orchestrator import handle_incident
+from .orchestrator import (
+    batch_error,
+    batch_workers,
+    handle_incident,
+    handle_incidents,
+    prewarm_agents,
+    stream_incident,
+)
+from .investigator import prewarm_tool_search
 
 
 app = BedrockAgentCoreApp()
@@ -10,20 +19,69 @@ app = BedrockAgentCoreApp()
 
 @app.entrypoint
 def handler(payload, _context=None):
+    if isinstance(payload, dict) and isinstance(payload.get("incidents"), list):
+        return handle_incidents(payload["incidents"], max_workers=batch_workers(payload.get("max_workers")))
+    if isinstance(payload, dict) and payload.get("stream"):
+        return stream_incident(payload)
     return handle_incident(payload)
 
 
+def _read_jsonl(f):
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, json.loads(line), None
+        except ValueError as exc:
+            yield line_number, None, exc
+
+
+def _run_batch(path: str) -> None:
+    if path == "-":
+        entries = list(_read_jsonl(sys.stdin))
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = list(_read_jsonl(f))
+
+    payloads = []
+    positions = []
+    for index, (line_number, payload, error) in enumerate(entries):
+        if error is not None:
+            result = batch_error(index, None, error)
+            result["line"] = line_number
+            print(json.dumps(result), flush=True)
+            continue
+        payloads.append(payload)
+        positions.append(index)
+
+    for result in handle_incidents(payloads):
+        result["batch_index"] = positions[result["batch_index"]]
+        print(json.dumps(result), flush=True)
+
+
 def _cli() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--input", help="Path to JSON incident payload")
+    parser.add_argument("--batch", help="Path to JSONL file of incident payloads ('-' for stdin)")
+    parser.add_argument("--stream", action="store_true", help="Print stage events as JSON lines as they complete")
     args = parser.parse_args()
 
+    if args.batch:
+        _run_batch(args.batch)
+        return
+
     if args.input:
         with open(args.input, "r", encoding="utf-8") as f:
             payload = json.load(f)
     else:
         payload = json.load(sys.stdin)
 
+    if args.stream:
+        for event in stream_incident(payload):
+            print(json.dumps(event), flush=True)
+        return
+
     result = handle_incident(payload)
     print(json.dumps(result, indent=2))
 
@@ -32,4 +90,6 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         _cli()
     else:
+        threading.Thread(target=prewarm_tool_search, name="tool-search-prewarm", daemon=True).start()
+        threading.Thread(target=prewarm_agents, name="agent-prewarm", daemon=True).start()
         app.run()
@@ -0,0 +1,146 @@
+import asyncio
+import weakref
+from contextlib import AsyncExitStack
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from .config import GATEWAY_MAX_INFLIGHT
+from .gateway_mcp import GatewayTokenProvider, get_token_provider, get_transport_factory
+
+
+class _OwnedSession:
+    def __init__(self, transport_factory: Callable[[], Any], generation: Optional[int]) -> None:
+        self.generation = generation
+        self.users = 0
+        self.retired = False
+        self.closed = False
+        self.ready: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self.task = asyncio.create_task(self._own(transport_factory))
+
+    async def _own(self, transport_factory: Callable[[], Any]) -> None:
+        from mcp import ClientSession
+
+        try:
+            async with AsyncExitStack() as stack:
+                streams = await stack.enter_async_context(transport_factory())
+                session = await stack.enter_async_context(ClientSession(streams[0], streams[1]))
+                await session.initialize()
+                self.ready.set_result(session)
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            if not self.ready.done():
+                self.ready.cancel()
+            raise
+        except Exception as exc:
+            if not self.ready.done():
+                self.ready.set_exception(exc)
+        finally:
+            self.closed = True
+
+    def close(self) -> None:
+        self._closing.set()
+
+
+class AsyncGatewayClient:
+    def __init__(
+        self,
+        transport_factory: Callable[[], Any],
+        max_inflight: int = GATEWAY_MAX_INFLIGHT,
+        token_provider: Optional[GatewayTokenProvider] = None,
+    ) -> None:
+        self._transport_factory = transport_factory
+        self._token_provider = token_provider
+        self._owned: Optional[_OwnedSession] = None
+        self._sessions: Set[_OwnedSession] = set()
+        self._inflight = asyncio.Semaphore(max(1, max_inflight))
+
+    async def _token_generation(self) -> Optional[int]:
+        provider = self._token_provider
+        if provider is None:
+            return None
+        if provider.stale():
+            await asyncio.to_thread(provider.token)
+        else:
+            provider.token()
+        return provider.generation
+
+    def _retire(self, owned: _OwnedSession) -> None:
+        if self._owned is owned:
+            self._owned = None
+        owned.retired = True
+        if owned.users == 0:
+            owned.close()
+
+    async def _acquire(self) -> Tuple[_OwnedSession, Any]:
+        generation = await self._token_generation()
+        owned = self._owned
+        if owned is not None and (owned.closed or owned.generation != generation):
+            self._retire(owned)
+            owned = None
+        if owned is None:
+            owned = self._owned = _OwnedSession(self._transport_factory, generation)
+            self._sessions.add(owned)
+            owned.task.add_done_callback(lambda _: self._sessions.discard(owned))
+        owned.users += 1
+        try:
+            return owned, await asyncio.shield(owned.ready)
+        except BaseException:
+            self._release(owned, broken=False)
+            raise
+
+    def _release(self, owned: _OwnedSession, broken: bool) -> None:
+        owned.users -= 1
+        if broken:
+            self._retire(owned)
+        elif owned.retired and owned.users == 0:
+            owned.close()
+
+    async def _run(self, fn: Callable[[Any], Awaitable[Any]], retry: bool = True) -> Any:
+        for attempt in range(2):
+            owned, session = await self._acquire()
+            try:
+                async with self._inflight:
+                    result = await fn(session)
+            except Exception:
+                self._release(owned, broken=True)
+                if not retry or attempt:
+                    raise
+                continue
+            except BaseException:
+                self._release(owned, broken=False)
+                raise
+            self._release(owned, broken=False)
+            return result
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any], idempotent: bool = True) -> Any:
+        return await self._run(lambda session: session.call_tool(name, arguments), retry=idempotent)
+
+    async def list_tools(self) -> List[Any]:
+        result = await self._run(lambda session: session.list_tools())
+        return list(getattr(result, "tools", []) or [])
+
+    async def aclose(self) -> None:
+        sessions, self._owned = list(self._sessions), None
+        for owned in sessions:
+            owned.retired = True
+            owned.close()
+        await asyncio.gather(*(owned.task for owned in sessions), return_exceptions=True)
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGatewayClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> AsyncGatewayClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        provider = get_token_provider()
+        client = AsyncGatewayClient(get_transport_factory(provider), token_provider=provider)
+        _clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
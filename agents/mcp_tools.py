@@ -1,17 +1,19 @@
 ﻿import json
-from typing import Any, Dict, List
-from strands.tools.mcp import MCPClient
-from .gateway_mcp import get_mcp_client
+import re
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+from .cache import TTLCache
+from .config import TOOL_SEARCH_CACHE_SIZE, TOOL_SEARCH_CACHE_TTL_SECONDS
+from .deadline import raise_if_cancelled
+from .gateway_pool import get_session_pool
+from .mcp_async import get_async_client
+from .tracing import span
 
 
-_mcp_client = None
-
-
-def _client() -> MCPClient:
-    global _mcp_client
-    if _mcp_client is None:
-        _mcp_client = get_mcp_client()
-    return _mcp_client
+_search_cache = TTLCache(TOOL_SEARCH_CACHE_SIZE, TOOL_SEARCH_CACHE_TTL_SECONDS)
+_UNKNOWN_TOOL_RE = re.compile(
+    r"unknown tool|tool not found|no such tool|tool \S+ (?:not found|does not exist)", re.IGNORECASE
+)
 
 
 def _normalize_tool_result(result: Any) -> Any:
@@ -25,45 +27,153 @@ def _normalize_tool_result(result: Any) -> Any:
     return result
 
 
-def _extract_tools(result: Any) -> List[Any]:
+def _content_text(item: Any) -> str:
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        return item.get("text") or ""
+    return getattr(item, "text", "") or ""
+
+
+def unwrap_tool_result(result: Any) -> Any:
     if isinstance(result, dict):
-        base = result.get("result", result)
-        if isinstance(base, dict):
-            if "structuredContent" in base:
-                return base.get("structuredContent", {}).get("tools", [])
-            if "tools" in base:
-                return base.get("tools", [])
-        return []
-    if hasattr(result, "structuredContent"):
-        return getattr(result, "structuredContent", {}).get("tools", [])
-    if hasattr(result, "content"):
+        base = result
+        if isinstance(result.get("result"), dict) and ("jsonrpc" in result or len(result) == 1):
+            base = result["result"]
+        structured = base.get("structuredContent")
+        content = base.get("content")
+    else:
+        base = result
+        structured = getattr(result, "structuredContent", None)
+        content = getattr(result, "content", None)
+    if isinstance(structured, dict) and structured:
+        return structured
+    if isinstance(content, list) and content:
         try:
-            content_text = "".join(getattr(item, "text", "") for item in result.content)
-            data = json.loads(content_text)
-            return data.get("tools", [])
-        except Exception:
-            return []
+            data = json.loads("".join(_content_text(item) for item in content))
+        except (TypeError, ValueError):
+            return base
+        if isinstance(data, dict):
+            return data
+    return base
+
+
+def _is_unknown_tool(value: Any) -> bool:
+    if isinstance(value, BaseException):
+        text = str(value)
+    elif isinstance(value, dict) and (value.get("isError") or value.get("is_error")):
+        text = " ".join(_content_text(item) for item in value.get("content") or [])
+    else:
+        return False
+    return bool(_UNKNOWN_TOOL_RE.search(text))
+
+
+def _forget_tool(name: str) -> None:
+    from .tool_registry import forget_tool_name
+
+    _search_cache.clear()
+    forget_tool_name(name)
+
+
+def _checked_result(name: str, result: Any) -> Any:
+    normalized = _normalize_tool_result(result)
+    if _is_unknown_tool(normalized):
+        _forget_tool(name)
+    return normalized
+
+
+def _extract_tools(result: Any) -> List[Any]:
+    payload = unwrap_tool_result(result)
+    if isinstance(payload, dict):
+        return payload.get("tools", []) or []
     return []
 
 
 def list_gateway_tools():
-    return _client().list_tools_sync()
+    with span("gateway.list_tools"):
+        return get_session_pool().run(lambda client: client.list_tools_sync())
 
 
-def search_gateway_tools(query: str, limit: int = 3) -> List[str]:
-    result = _client().call_tool_sync("x_amz_bedrock_agentcore_search", {"query": query})
-    tools = _extract_tools(result)
+@contextmanager
+def leased_gateway_tools() -> Iterator[List[Any]]:
+    with get_session_pool().lease() as client:
+        with span("gateway.list_tools"):
+            tools = client.list_tools_sync()
+        yield tools
+
+
+def _tool_names(result: Any) -> List[str]:
     names: List[str] = []
-    for tool in tools:
+    for tool in _extract_tools(result):
         if isinstance(tool, dict):
             name = tool.get("name")
         else:
             name = getattr(tool, "name", None) or str(tool)
         if name:
             names.append(name)
+    return names
+
+
+def search_gateway_tools(query: str, limit: int = 3) -> List[str]:
+    cached = _search_cache.get(query)
+    if cached is not None:
+        return list(cached[:limit])
+
+    with span("gateway.search", query=query):
+        result = get_session_pool().run(
+            lambda client: client.call_tool_sync("x_amz_bedrock_agentcore_search", {"query": query})
+        )
+    names = _tool_names(result)
+    _search_cache.set(query, tuple(names))
+    return names[:limit]
+
+
+def search_cache_stats() -> Dict[str, Any]:
+    return _search_cache.stats()
+
+
+def gateway_pool_stats() -> Dict[str, Any]:
+    return get_session_pool().stats()
+
+
+def call_gateway_tool(name: str, arguments: Dict[str, Any], idempotent: bool = True):
+    if not idempotent:
+        raise_if_cancelled()
+    with span("gateway.call_tool", tool=name):
+        try:
+            result = get_session_pool().run(lambda client: client.call_tool_sync(name, arguments), retry=idempotent)
+        except Exception as exc:
+            if _is_unknown_tool(exc):
+                _forget_tool(name)
+            raise
+    return _checked_result(name, result)
+
+
+async def alist_gateway_tools():
+    with span("gateway.list_tools"):
+        return await get_async_client().list_tools()
+
+
+async def asearch_gateway_tools(query: str, limit: int = 3) -> List[str]:
+    cached = _search_cache.get(query)
+    if cached is not None:
+        return list(cached[:limit])
+
+    with span("gateway.search", query=query):
+        result = await get_async_client().call_tool("x_amz_bedrock_agentcore_search", {"query": query})
+    names = _tool_names(result)
+    _search_cache.set(query, tuple(names))
     return names[:limit]
 
 
-def call_gateway_tool(name: str, arguments: Dict[str, Any]):
-    result = _client().call_tool_sync(name, arguments)
-    return _normalize_tool_result(result)
+async def acall_gateway_tool(name: str, arguments: Dict[str, Any], idempotent: bool = True):
+    if not idempotent:
+        raise_if_cancelled()
+    with span("gateway.call_tool", tool=name):
+        try:
+            result = await get_async_client().call_tool(name, arguments, idempotent=idempotent)
+        except Exception as exc:
+            if _is_unknown_tool(exc):
+                _forget_tool(name)
+            raise
+    return _checked_result(name, result)
@@ -1,31 +1,40 @@
-from typing import Dict, Any
+import asyncio
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, AsyncIterator, Iterable, Iterator, Optional, Tuple
 import json
 
-import boto3
-
 from .schemas import Incident, RCA
 from .intent_classifier import classify_intent, is_non_incident_access_request
-from .investigator import investigate
-from .action_agent import act
+from .investigator import ainvestigate, investigate
+from .action_agent import aact, act
 from .agent_tools import intent_classifier, investigator, action_agent
-from .prompts import ORCHESTRATOR_PROMPT
-from .config import RCA_BUCKET, RCA_PREFIX, STRANDS_ENABLE_LLM
-from .agent_factory import build_agent
+from .prompts import ACTION_PROMPT, INTENT_CLASSIFIER_PROMPT, INVESTIGATOR_PROMPT, ORCHESTRATOR_PROMPT
+from .config import BATCH_MAX_WORKERS, INCIDENT_LATENCY_BUDGET_SECONDS, RCA_BUCKET, STRANDS_ENABLE_LLM
+from .agent_factory import agent_session, warm_agent
+from .deadline import call_with_deadline, current_deadline, incident_deadline
+from .coalescing import coalesce_key, get_coalescer
+from .streaming import NO_EVENTS, StageEmitter, aiterate_events, iterate_events
+from .tracing import span, trace_incident, traced
 from .policy import compute_policy_score
-from .servicenow import update_ticket
+from .servicenow import aupdate_ticket, update_ticket
 from .validation import validate_intent, validate_investigation, validate_action, validate_orchestrator
 from .workflows import select_workflow, workflow_profile
 from .evaluation import evaluate_workflow
-from .agentcore_governance import apply_agentcore_governance
+from .agentcore_governance import apply_agentcore_governance, fetch_policy_context
+from .tool_registry import preload_tool_names
+from .rca_sink import get_rca_sink
+from .mcp_tools import leased_gateway_tools
+
 
-s3 = boto3.client("s3")
+_ORCHESTRATOR_TOOLS = [intent_classifier, investigator, action_agent]
 
 
+@traced("rca.write")
 def _write_rca(incident_id: str, rca: RCA) -> None:
     if not RCA_BUCKET:
         return
-    key = f"{RCA_PREFIX.rstrip('/')}/{incident_id}.json"
-    s3.put_object(Bucket=RCA_BUCKET, Key=key, Body=rca.model_dump_json(indent=2).encode("utf-8"))
+    get_rca_sink().submit(incident_id, rca)
 
 
 def _parse_llm_result(result: Any) -> Dict[str, Any]:
@@ -34,13 +43,26 @@ def _parse_llm_result(result: Any) -> Dict[str, Any]:
     return json.loads(result)
 
 
+@traced("llm.orchestrator")
 def _run_llm(incident: Incident) -> Dict[str, Any]:
-    tools = [intent_classifier, investigator, action_agent]
-    agent = build_agent(ORCHESTRATOR_PROMPT, tools=tools)
-    result = agent(json.dumps(incident.model_dump()))
+    with agent_session(ORCHESTRATOR_PROMPT, tools=_ORCHESTRATOR_TOOLS) as agent:
+        result = agent(json.dumps(incident.model_dump()))
     return _parse_llm_result(result)
 
 
+def prewarm_agents() -> None:
+    if not STRANDS_ENABLE_LLM:
+        return
+    warm_agent(ORCHESTRATOR_PROMPT, tools=_ORCHESTRATOR_TOOLS)
+    warm_agent(INTENT_CLASSIFIER_PROMPT)
+    try:
+        with leased_gateway_tools() as gateway_tools:
+            warm_agent(INVESTIGATOR_PROMPT, tools=gateway_tools)
+            warm_agent(ACTION_PROMPT, tools=gateway_tools)
+    except Exception:
+        return
+
+
 def _validate_outputs(
     intent_data: Dict[str, Any],
     investigation_data: Dict[str, Any],
@@ -53,46 +75,160 @@ def _validate_outputs(
     }
 
 
-def handle_incident(payload: Dict[str, Any]) -> Dict[str, Any]:
-    incident = Incident(**payload)
+def _access_request_outputs(incident: Incident) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    intent_data = classify_intent(incident, force_rule_based=True).model_dump()
+    investigation_data = {
+        "intent": intent_data["intent"],
+        "evidence": {
+            "skipped": True,
+            "reason": "Access request is not an incident investigation workflow",
+            "required_process": "Use IAM/change-management access request process",
+        },
+    }
+    action_data = {
+        "intent": intent_data["intent"],
+        "actions": [
+            {
+                "policy_block": (
+                    "Production access cannot be granted by incident automation. "
+                    "Please submit IAM/change-management access request."
+                )
+            }
+        ],
+        "status": "blocked",
+    }
+    return intent_data, investigation_data, action_data
+
+
+def _collect_staged(
+    incident: Incident, emitter: StageEmitter
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    with span("classify_intent"):
+        intent_data = classify_intent(incident).model_dump()
+    emitter.emit("intent", intent_data)
+    with span("investigate", intent=intent_data["intent"]):
+        investigation_data = investigate(incident, intent_data["intent"], on_step=emitter.step).model_dump()
+    emitter.emit("investigation", investigation_data)
+    with span("act", intent=intent_data["intent"]):
+        action_data = act(incident, intent_data["intent"]).model_dump()
+    emitter.emit("actions", action_data)
+    return intent_data, investigation_data, action_data
+
+
+def _collect(
+    incident: Incident, emitter: StageEmitter = NO_EVENTS
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
     if is_non_incident_access_request(incident):
-        intent_data = classify_intent(incident, force_rule_based=True).model_dump()
-        investigation_data = {
-            "intent": intent_data["intent"],
-            "evidence": {
-                "skipped": True,
-                "reason": "Access request is not an incident investigation workflow",
-                "required_process": "Use IAM/change-management access request process",
-            },
-        }
-        action_data = {
-            "intent": intent_data["intent"],
-            "actions": [
-                {
-                    "policy_block": (
-                        "Production access cannot be granted by incident automation. "
-                        "Please submit IAM/change-management access request."
-                    )
-                }
-            ],
-            "status": "blocked",
-        }
+        return _access_request_outputs(incident)
 
-    elif STRANDS_ENABLE_LLM:
+    if STRANDS_ENABLE_LLM:
         try:
-            outcome = _run_llm(incident)
-            intent_data = outcome.get("intent", {})
-            investigation_data = outcome.get("investigation", {})
-            action_data = outcome.get("actions", {})
+            outcome = call_with_deadline(_run_llm, incident)
+            return outcome.get("intent", {}), outcome.get("investigation", {}), outcome.get("actions", {})
         except Exception:
-            intent_data = classify_intent(incident).model_dump()
-            investigation_data = investigate(incident, intent_data["intent"]).model_dump()
-            action_data = act(incident, intent_data["intent"]).model_dump()
-    else:
+            pass
+    return _collect_staged(incident, emitter)
+
+
+async def _acollect(
+    incident: Incident, emitter: StageEmitter = NO_EVENTS
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    if STRANDS_ENABLE_LLM or is_non_incident_access_request(incident):
+        return await asyncio.to_thread(_collect, incident, emitter)
+    with span("classify_intent"):
         intent_data = classify_intent(incident).model_dump()
-        investigation_data = investigate(incident, intent_data["intent"]).model_dump()
-        action_data = act(incident, intent_data["intent"]).model_dump()
+    emitter.emit("intent", intent_data)
+    with span("investigate", intent=intent_data["intent"]):
+        investigation_data = (await ainvestigate(incident, intent_data["intent"], on_step=emitter.step)).model_dump()
+    emitter.emit("investigation", investigation_data)
+    with span("act", intent=intent_data["intent"]):
+        action_data = (await aact(incident, intent_data["intent"])).model_dump()
+    emitter.emit("actions", action_data)
+    return intent_data, investigation_data, action_data
 
+
+def _claim(incident: Incident) -> Tuple[Optional[str], str, Optional[Future]]:
+    if is_non_incident_access_request(incident):
+        return None, "", None
+    key = coalesce_key(incident, classify_intent(incident, force_rule_based=True).intent)
+    if key is None:
+        return None, "", None
+    role, future = get_coalescer().claim(key)
+    return key, role, future
+
+
+def _wait_budget() -> float:
+    deadline = current_deadline()
+    return INCIDENT_LATENCY_BUDGET_SECONDS if deadline is None else deadline.remaining()
+
+
+def _shared_outputs(
+    key: str,
+    role: str,
+    shared: Tuple[str, Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]],
+) -> Tuple[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Dict[str, Any]]:
+    leader_id, outputs = shared
+    intent_data, investigation_data, action_data = copy.deepcopy(outputs)
+    coalesced = {"key": key, "role": role, "leader_incident_id": leader_id}
+    action_data.setdefault("actions", []).append({"coalesced": dict(coalesced)})
+    return (intent_data, investigation_data, action_data), coalesced
+
+
+def _collect_coalesced(
+    incident: Incident,
+    emitter: StageEmitter = NO_EVENTS,
+) -> Tuple[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Optional[Dict[str, Any]]]:
+    key, role, future = _claim(incident)
+    if key is None or future is None:
+        return _collect(incident, emitter), None
+
+    if role == "leader":
+        try:
+            outputs = _collect(incident, emitter)
+        except BaseException as exc:
+            get_coalescer().fail(key, future, exc)
+            raise
+        get_coalescer().complete(key, future, (incident.incident_id, copy.deepcopy(outputs)))
+        return outputs, {"key": key, "role": role, "leader_incident_id": incident.incident_id}
+
+    try:
+        shared = future.result(timeout=_wait_budget())
+    except Exception:
+        return _collect(incident, emitter), None
+    return _shared_outputs(key, role, shared)
+
+
+async def _acollect_coalesced(
+    incident: Incident,
+    emitter: StageEmitter = NO_EVENTS,
+) -> Tuple[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Optional[Dict[str, Any]]]:
+    key, role, future = _claim(incident)
+    if key is None or future is None:
+        return await _acollect(incident, emitter), None
+
+    if role == "leader":
+        try:
+            outputs = await _acollect(incident, emitter)
+        except BaseException as exc:
+            get_coalescer().fail(key, future, exc)
+            raise
+        get_coalescer().complete(key, future, (incident.incident_id, copy.deepcopy(outputs)))
+        return outputs, {"key": key, "role": role, "leader_incident_id": incident.incident_id}
+
+    try:
+        shared = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=_wait_budget())
+    except Exception:
+        return await _acollect(incident, emitter), None
+    return _shared_outputs(key, role, shared)
+
+
+def _decide(
+    incident: Incident,
+    intent_data: Dict[str, Any],
+    investigation_data: Dict[str, Any],
+    action_data: Dict[str, Any],
+    policy_context: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], str]:
     validation_errors = _validate_outputs(intent_data, investigation_data, action_data)
     selected_workflow = select_workflow(intent_data.get("intent", "unknown"), incident)
     profile = workflow_profile(selected_workflow)
@@ -131,6 +267,7 @@ def handle_incident(payload: Dict[str, Any]) -> Dict[str, Any]:
         workflow_profile=profile,
         decision=decision.decision,
         evaluation=evaluation,
+        policy_context=policy_context,
     )
     decision.decision = governed_decision
     decision.reasons.extend(governance_reasons)
@@ -156,15 +293,12 @@ def handle_incident(payload: Dict[str, Any]) -> Dict[str, Any]:
     _write_rca(incident.incident_id, rca)
 
     sn_context = incident.context.get("servicenow") if isinstance(incident.context, dict) else None
-    sn_update = None
-    if sn_context:
-        rca_text = (
-            f"Decision: {decision.decision}\n"
-            f"Score: {decision.policy_score}\n"
-            f"Workflow: {selected_workflow.workflow_id}\n"
-            f"Reasons: {', '.join(decision.reasons)}"
-        )
-        sn_update = update_ticket(sn_context, decision.decision, rca_text)
+    rca_text = (
+        f"Decision: {decision.decision}\n"
+        f"Score: {decision.policy_score}\n"
+        f"Workflow: {selected_workflow.workflow_id}\n"
+        f"Reasons: {', '.join(decision.reasons)}"
+    )
 
     output = {
         "incident_id": incident.incident_id,
@@ -176,10 +310,13 @@ def handle_incident(payload: Dict[str, Any]) -> Dict[str, Any]:
         "agentcore_governance": governance,
         "policy": decision.model_dump(),
         "validation": validation_errors,
-        "servicenow": sn_update,
+        "servicenow": None,
         "rca": rca.model_dump(),
     }
+    return output, sn_context or None, rca_text
+
 
+def _finish(output: Dict[str, Any]) -> Dict[str, Any]:
     output_errors = validate_orchestrator(output)
     if output_errors:
         output["validation"].setdefault("orchestrator", []).extend(output_errors)
@@ -187,3 +324,177 @@ def handle_incident(payload: Dict[str, Any]) -> Dict[str, Any]:
         output["policy"]["reasons"].append("Orchestrator output schema failed")
 
     return output
+
+
+def _attach_coalesced(output: Dict[str, Any], rca_text: str, coalesced: Optional[Dict[str, Any]]) -> str:
+    if coalesced is None:
+        return rca_text
+    output["coalesced"] = coalesced
+    if coalesced["role"] == "leader":
+        return rca_text
+    return f"{rca_text}\nCoalesced with: {coalesced['leader_incident_id']} ({coalesced['role']})"
+
+
+def _publish_collected(
+    emitter: StageEmitter,
+    intent_data: Dict[str, Any],
+    investigation_data: Dict[str, Any],
+    action_data: Dict[str, Any],
+) -> None:
+    emitter.ensure("intent", intent_data)
+    emitter.ensure("investigation", investigation_data)
+    emitter.ensure("actions", action_data)
+
+
+def _decision_event(output: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "workflow": output["workflow"],
+        "evaluation": output["evaluation"],
+        "agentcore_governance": output["agentcore_governance"],
+        "policy": output["policy"],
+    }
+
+
+def _process(incident: Incident, policy_context: Optional[Dict[str, Any]], emitter: StageEmitter) -> Dict[str, Any]:
+    with trace_incident(incident.incident_id) as trace:
+        with incident_deadline(), span("collect"):
+            (intent_data, investigation_data, action_data), coalesced = _collect_coalesced(incident, emitter)
+        _publish_collected(emitter, intent_data, investigation_data, action_data)
+        with span("decide"):
+            output, sn_context, rca_text = _decide(
+                incident, intent_data, investigation_data, action_data, policy_context
+            )
+        rca_text = _attach_coalesced(output, rca_text, coalesced)
+        emitter.emit("decision", _decision_event(output))
+        if sn_context:
+            output["servicenow"] = update_ticket(sn_context, output["policy"]["decision"], rca_text)
+            emitter.emit("servicenow", output["servicenow"])
+        result = _finish(output)
+        if trace is not None:
+            result["timings"] = trace.summary()
+    emitter.emit("result", result)
+    return result
+
+
+async def _aprocess(
+    incident: Incident, policy_context: Optional[Dict[str, Any]], emitter: StageEmitter
+) -> Dict[str, Any]:
+    with trace_incident(incident.incident_id) as trace:
+        with incident_deadline(), span("collect"):
+            (intent_data, investigation_data, action_data), coalesced = await _acollect_coalesced(incident, emitter)
+        _publish_collected(emitter, intent_data, investigation_data, action_data)
+
+        with span("decide"):
+            output, sn_context, rca_text = await asyncio.to_thread(
+                _decide, incident, intent_data, investigation_data, action_data, policy_context
+            )
+        rca_text = _attach_coalesced(output, rca_text, coalesced)
+        emitter.emit("decision", _decision_event(output))
+        if sn_context:
+            output["servicenow"] = await aupdate_ticket(sn_context, output["policy"]["decision"], rca_text)
+            emitter.emit("servicenow", output["servicenow"])
+        result = _finish(output)
+        if trace is not None:
+            result["timings"] = trace.summary()
+    emitter.emit("result", result)
+    return result
+
+
+def handle_incident(payload: Dict[str, Any], policy_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return _process(Incident(**payload), policy_context, NO_EVENTS)
+
+
+async def ahandle_incident(payload: Dict[str, Any], policy_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return await _aprocess(Incident(**payload), policy_context, NO_EVENTS)
+
+
+def stream_incident(
+    payload: Dict[str, Any], policy_context: Optional[Dict[str, Any]] = None
+) -> Iterator[Dict[str, Any]]:
+    incident = Incident(**payload)
+    return iterate_events(incident.incident_id, lambda emitter: _process(incident, policy_context, emitter))
+
+
+def astream_incident(
+    payload: Dict[str, Any], policy_context: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    incident = Incident(**payload)
+    return aiterate_events(incident.incident_id, lambda emitter: _aprocess(incident, policy_context, emitter))
+
+
+def batch_workers(value: Any) -> Optional[int]:
+    try:
+        workers = int(value)
+    except (TypeError, ValueError):
+        return None
+    if workers <= 0:
+        return None
+    return min(workers, BATCH_MAX_WORKERS)
+
+
+def batch_error(index: int, payload: Any, exc: Exception) -> Dict[str, Any]:
+    incident_id = payload.get("incident_id") if isinstance(payload, dict) else None
+    return {
+        "incident_id": incident_id,
+        "batch_index": index,
+        "error": f"{exc.__class__.__name__}: {exc}",
+    }
+
+
+def handle_incidents(
+    payloads: Iterable[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    items = list(payloads)
+    if not items:
+        return
+
+    try:
+        preload_tool_names()
+    except Exception:
+        pass
+    policy_context = fetch_policy_context()
+
+    workers = max(1, min(len(items), max_workers or BATCH_MAX_WORKERS))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="incident-batch") as executor:
+        futures = {
+            executor.submit(handle_incident, payload, policy_context): (index, payload)
+            for index, payload in enumerate(items)
+        }
+        for future in as_completed(futures):
+            index, payload = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:
+                yield batch_error(index, payload, exc)
+                continue
+            result["batch_index"] = index
+            yield result
+
+
+async def ahandle_incidents(
+    payloads: Iterable[Dict[str, Any]],
+    max_concurrency: Optional[int] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    items = list(payloads)
+    if not items:
+        return
+
+    try:
+        await asyncio.to_thread(preload_tool_names)
+    except Exception:
+        pass
+    policy_context = await asyncio.to_thread(fetch_policy_context)
+    limit = asyncio.Semaphore(max(1, max_concurrency or BATCH_MAX_WORKERS))
+
+    async def _run(index: int, payload: Dict[str, Any]) -> Dict[str, Any]:
+        async with limit:
+            try:
+                result = await ahandle_incident(payload, policy_context)
+            except Exception as exc:
+                return batch_error(index, payload, exc)
+            result["batch_index"] = index
+            return result
+
+    for next_result in asyncio.as_completed([_run(index, payload) for index, payload in enumerate(items)]):
+        yield await next_result
@@ -61,7 +61,7 @@ def compute_policy_score(
         source_check = evidence.get("source_check", {})
         if isinstance(source_check, dict):
             status = source_check.get("status")
-            if status in ("zero_data", "missing_data"):
+            if status in ("zero_data", "missing_data", "low_volume", "late"):
                 score += 0.2
                 reasons.append(f"Source data status: {status}")
 
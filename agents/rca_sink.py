@@ -0,0 +1,231 @@
+import atexit
+import gzip
+import logging
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from .aws_clients import get_client
+from .config import (
+    RCA_BUCKET,
+    RCA_PREFIX,
+    RCA_SINK_BACKOFF_BASE_SECONDS,
+    RCA_SINK_BACKOFF_MAX_SECONDS,
+    RCA_SINK_BATCH_SIZE,
+    RCA_SINK_FLUSH_SECONDS,
+    RCA_SINK_GZIP,
+    RCA_SINK_MAX_REQUEUES,
+    RCA_SINK_MAX_RETRIES,
+    RCA_SINK_MODE,
+    RCA_SINK_NDJSON,
+)
+from .schemas import RCA
+
+_log = logging.getLogger(__name__)
+
+_Item = Tuple[str, bytes, int]
+
+
+class RcaSink:
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str,
+        batch_size: int = 25,
+        flush_interval: float = 2.0,
+        gzip_enabled: bool = False,
+        ndjson_enabled: bool = False,
+        synchronous: bool = False,
+        max_retries: int = RCA_SINK_MAX_RETRIES,
+        max_requeues: int = RCA_SINK_MAX_REQUEUES,
+        backoff_base: float = RCA_SINK_BACKOFF_BASE_SECONDS,
+        backoff_max: float = RCA_SINK_BACKOFF_MAX_SECONDS,
+    ) -> None:
+        self.bucket = bucket
+        self.prefix = prefix.rstrip("/")
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.gzip_enabled = gzip_enabled
+        self.ndjson_enabled = ndjson_enabled
+        self.synchronous = synchronous
+        self.max_retries = max(0, max_retries)
+        self.max_requeues = max(0, max_requeues)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._buffer: List[_Item] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "parts_written": 0,
+            "flushes": 0,
+            "errors": 0,
+            "requeued": 0,
+            "dropped": 0,
+        }
+        self.last_error: Optional[str] = None
+
+    def _encode(self, body: bytes) -> bytes:
+        return gzip.compress(body) if self.gzip_enabled else body
+
+    def _put(self, key: str, body: bytes, content_type: str) -> None:
+        kwargs: Dict[str, Any] = {
+            "Bucket": self.bucket,
+            "Key": key,
+            "Body": self._encode(body),
+            "ContentType": content_type,
+        }
+        if self.gzip_enabled:
+            kwargs["Key"] = f"{key}.gz"
+            kwargs["ContentEncoding"] = "gzip"
+        get_client("s3").put_object(**kwargs)
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2**attempt)))
+
+    def _put_with_retry(self, key: str, body: bytes, content_type: str) -> None:
+        attempt = 0
+        while True:
+            try:
+                self._put(key, body, content_type)
+                return
+            except Exception as exc:
+                self.last_error = f"{exc.__class__.__name__}: {exc}"
+                with self._lock:
+                    self._stats["errors"] += 1
+                if attempt >= self.max_retries:
+                    raise
+            time.sleep(self._backoff(attempt))
+            attempt += 1
+
+    def _write(self, batch: List[_Item]) -> List[_Item]:
+        failed: List[_Item] = []
+        for item in batch:
+            try:
+                self._put_with_retry(f"{self.prefix}/{item[0]}.json", item[1], "application/json")
+                with self._lock:
+                    self._stats["written"] += 1
+            except Exception:
+                failed.append(item)
+
+        if self.ndjson_enabled and batch:
+            stamp = time.strftime("%Y/%m/%d", time.gmtime())
+            key = f"{self.prefix}/parts/{stamp}/part-{int(time.time())}-{uuid.uuid4().hex[:8]}.ndjson"
+            try:
+                self._put_with_retry(key, b"\n".join(item[1] for item in batch) + b"\n", "application/x-ndjson")
+                with self._lock:
+                    self._stats["parts_written"] += 1
+            except Exception:
+                _log.error("Failed to write RCA part file %s: %s", key, self.last_error)
+
+        with self._lock:
+            self._stats["flushes"] += 1
+        return failed
+
+    def _drop(self, item: _Item) -> None:
+        with self._lock:
+            self._stats["dropped"] += 1
+        _log.error(
+            "Dropping RCA for incident %s after %d failed flushes: %s", item[0], item[2] + 1, self.last_error
+        )
+
+    def _requeue(self, failed: List[_Item]) -> None:
+        retained: List[_Item] = []
+        for incident_id, body, requeues in failed:
+            if self._closed or requeues >= self.max_requeues:
+                self._drop((incident_id, body, requeues))
+            else:
+                retained.append((incident_id, body, requeues + 1))
+        if retained:
+            _log.warning("Re-queued %d RCA documents after failed writes: %s", len(retained), self.last_error)
+            with self._lock:
+                self._stats["requeued"] += len(retained)
+                self._buffer[:0] = retained
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="rca-sink", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def submit(self, incident_id: str, rca: RCA) -> None:
+        if not self.bucket:
+            return
+        body = rca.model_dump_json().encode("utf-8")
+
+        if self.synchronous or self._closed:
+            with self._lock:
+                self._stats["submitted"] += 1
+            failed = self._write([(incident_id, body, 0)])
+            if failed:
+                self._drop(failed[0])
+                raise RuntimeError(f"Failed to write RCA for incident {incident_id}: {self.last_error}")
+            return
+
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._buffer.append((incident_id, body, 0))
+            full = len(self._buffer) >= self.batch_size
+            self._ensure_worker()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if batch:
+                self._requeue(self._write(batch))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        self._closed = True
+        self._wake.set()
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            worker.join(timeout if timeout is not None else self.flush_interval + 5.0)
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["buffered"] = len(self._buffer)
+        stats["last_error"] = self.last_error
+        return stats
+
+
+_sink: Optional[RcaSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_rca_sink() -> RcaSink:
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = RcaSink(
+                    bucket=RCA_BUCKET,
+                    prefix=RCA_PREFIX,
+                    batch_size=RCA_SINK_BATCH_SIZE,
+                    flush_interval=RCA_SINK_FLUSH_SECONDS,
+                    gzip_enabled=RCA_SINK_GZIP,
+                    ndjson_enabled=RCA_SINK_NDJSON,
+                    synchronous=RCA_SINK_MODE == "sync",
+                )
+                atexit.register(_sink.close)
+    return _sink
+
+
+def flush_rca_sink() -> None:
+    if _sink is not None:
+        _sink.flush()
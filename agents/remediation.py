@@ -0,0 +1,284 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .config import (
+    REMEDIATION_BACKEND,
+    REMEDIATION_COOLDOWN_SECONDS,
+    REMEDIATION_DB_PATH,
+    REMEDIATION_LEASE_SECONDS,
+    REMEDIATION_POLL_SECONDS,
+    REMEDIATION_WAIT_SECONDS,
+)
+
+
+def remediation_key(tool_suffix: str, ctx: Dict[str, Any]) -> str:
+    return f"{tool_suffix}|{json.dumps(ctx or {}, sort_keys=True, default=str)}"
+
+
+class MemoryBackend:
+    def __init__(self) -> None:
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def begin(self, key: str, owner: str, lease: float, cooldown: float) -> Tuple[str, Optional[Dict[str, Any]]]:
+        now = time.time()
+        with self._lock:
+            row = self._rows.get(key)
+            if row is not None:
+                if row["state"] == "running" and row["lease_expires"] > now:
+                    return "running", None
+                if row["state"] == "done" and row["finished_at"] + cooldown > now:
+                    return "cooldown", dict(row)
+            self._rows[key] = {"state": "running", "owner": owner, "lease_expires": now + lease}
+            return "acquired", None
+
+    def finish(self, key: str, owner: str, result: Any) -> None:
+        with self._lock:
+            row = self._rows.get(key)
+            if row is None or row.get("owner") == owner:
+                self._rows[key] = {"state": "done", "owner": owner, "finished_at": time.time(), "result": result}
+
+    def abort(self, key: str, owner: str) -> None:
+        with self._lock:
+            row = self._rows.get(key)
+            if row is not None and row.get("owner") == owner and row["state"] == "running":
+                del self._rows[key]
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._rows.get(key)
+            return dict(row) if row is not None else None
+
+
+class SQLiteBackend:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS remediation ("
+                "key TEXT PRIMARY KEY, state TEXT NOT NULL, owner TEXT NOT NULL, "
+                "lease_expires REAL, finished_at REAL, result TEXT)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def begin(self, key: str, owner: str, lease: float, cooldown: float) -> Tuple[str, Optional[Dict[str, Any]]]:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT state, lease_expires, finished_at, result FROM remediation WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                state, lease_expires, finished_at, result = row
+                if state == "running" and (lease_expires or 0) > now:
+                    conn.execute("COMMIT")
+                    return "running", None
+                if state == "done" and (finished_at or 0) + cooldown > now:
+                    conn.execute("COMMIT")
+                    return "cooldown", {"state": state, "finished_at": finished_at, "result": json.loads(result)}
+            conn.execute(
+                "INSERT OR REPLACE INTO remediation (key, state, owner, lease_expires, finished_at, result) "
+                "VALUES (?, 'running', ?, ?, NULL, NULL)",
+                (key, owner, now + lease),
+            )
+            conn.execute("COMMIT")
+            return "acquired", None
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def finish(self, key: str, owner: str, result: Any) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(
+                "UPDATE remediation SET state = 'done', finished_at = ?, lease_expires = NULL, result = ? "
+                "WHERE key = ? AND owner = ?",
+                (time.time(), json.dumps(result, default=str), key, owner),
+            )
+        finally:
+            conn.close()
+
+    def abort(self, key: str, owner: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM remediation WHERE key = ? AND owner = ? AND state = 'running'", (key, owner))
+        finally:
+            conn.close()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT state, finished_at, result FROM remediation WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        state, finished_at, result = row
+        return {"state": state, "finished_at": finished_at, "result": json.loads(result) if result else None}
+
+
+def _deduplicated(reason: str, result: Any, **extra: Any) -> Dict[str, Any]:
+    return {"deduplicated": reason, "result": result, **extra}
+
+
+def _is_error_result(result: Any) -> bool:
+    return isinstance(result, dict) and bool(result.get("is_error") or result.get("isError"))
+
+
+def _shared(result: Any) -> Any:
+    if isinstance(result, dict) and "deduplicated" in result:
+        return result
+    return _deduplicated("in_flight", result)
+
+
+class RemediationGuard:
+    def __init__(
+        self,
+        backend: Any,
+        cooldown: float = REMEDIATION_COOLDOWN_SECONDS,
+        lease: float = REMEDIATION_LEASE_SECONDS,
+        wait: float = REMEDIATION_WAIT_SECONDS,
+        poll_interval: float = REMEDIATION_POLL_SECONDS,
+    ) -> None:
+        self.backend = backend
+        self.cooldown = cooldown
+        self.lease = lease
+        self.wait = wait
+        self.poll_interval = poll_interval
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _claim(self, key: str) -> Tuple[bool, Future]:
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return False, future
+            future = Future()
+            self._inflight[key] = future
+            return True, future
+
+    def _settle(self, key: str, future: Future, result: Any = None, exc: Optional[BaseException] = None) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        if future.cancelled():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _begin(self, key: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        return self.backend.begin(key, self._owner, self.lease, self.cooldown)
+
+    def _cooldown_result(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        retry_after = max(0.0, row["finished_at"] + self.cooldown - time.time())
+        return _deduplicated("cooldown", row.get("result"), retry_after_seconds=round(retry_after, 1))
+
+    def _poll_remote(self, key: str) -> Dict[str, Any]:
+        deadline = time.monotonic() + self.wait
+        while time.monotonic() < deadline:
+            row = self.backend.lookup(key)
+            if row is None or row["state"] == "done":
+                return _deduplicated("in_flight_elsewhere", row.get("result") if row else None)
+            time.sleep(self.poll_interval)
+        return _deduplicated("in_flight_elsewhere", None, timed_out=True)
+
+    def _lead(self, key: str, fn: Callable[[], Any]) -> Any:
+        status, row = self._begin(key)
+        if status == "cooldown" and row is not None:
+            return self._cooldown_result(row)
+        if status == "running":
+            return self._poll_remote(key)
+        try:
+            result = fn()
+        except BaseException:
+            self.backend.abort(key, self._owner)
+            raise
+        if _is_error_result(result):
+            self.backend.abort(key, self._owner)
+        else:
+            self.backend.finish(key, self._owner, result)
+        return result
+
+    def run(self, tool_suffix: str, ctx: Dict[str, Any], fn: Callable[[], Any]) -> Any:
+        key = remediation_key(tool_suffix, ctx)
+        leader, future = self._claim(key)
+        if not leader:
+            return _shared(future.result(timeout=self.wait))
+        try:
+            result = self._lead(key, fn)
+        except BaseException as exc:
+            self._settle(key, future, exc=exc)
+            raise
+        self._settle(key, future, result=result)
+        return result
+
+    async def _alead(self, key: str, afn: Callable[[], Awaitable[Any]]) -> Any:
+        status, row = await asyncio.to_thread(self._begin, key)
+        if status == "cooldown" and row is not None:
+            return self._cooldown_result(row)
+        if status == "running":
+            return await asyncio.to_thread(self._poll_remote, key)
+        try:
+            result = await afn()
+        except BaseException:
+            await asyncio.to_thread(self.backend.abort, key, self._owner)
+            raise
+        if _is_error_result(result):
+            await asyncio.to_thread(self.backend.abort, key, self._owner)
+        else:
+            await asyncio.to_thread(self.backend.finish, key, self._owner, result)
+        return result
+
+    async def arun(self, tool_suffix: str, ctx: Dict[str, Any], afn: Callable[[], Awaitable[Any]]) -> Any:
+        key = remediation_key(tool_suffix, ctx)
+        leader, future = self._claim(key)
+        if not leader:
+            shared = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=self.wait)
+            return _shared(shared)
+        try:
+            result = await self._alead(key, afn)
+        except BaseException as exc:
+            self._settle(key, future, exc=exc)
+            raise
+        self._settle(key, future, result=result)
+        return result
+
+
+def _build_backend() -> Any:
+    if REMEDIATION_BACKEND == "sqlite":
+        return SQLiteBackend(REMEDIATION_DB_PATH)
+    if REMEDIATION_BACKEND == "memory":
+        return MemoryBackend()
+    raise ValueError(f"Unsupported REMEDIATION_BACKEND: {REMEDIATION_BACKEND}")
+
+
+_guard: Optional[RemediationGuard] = None
+_guard_lock = threading.Lock()
+
+
+def get_remediation_guard() -> RemediationGuard:
+    global _guard
+    if _guard is None:
+        with _guard_lock:
+            if _guard is None:
+                _guard = RemediationGuard(_build_backend())
+    return _guard
@@ -1,5 +1,7 @@
 ﻿from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .keywords import NormalizedText
 
 
 class Incident(BaseModel):
@@ -10,6 +12,14 @@ class Incident(BaseModel):
     tags: List[str] = []
     context: Dict[str, Any] = {}
 
+    _normalized: Optional[NormalizedText] = PrivateAttr(default=None)
+
+    @property
+    def normalized(self) -> NormalizedText:
+        if self._normalized is None:
+            self._normalized = NormalizedText(f"{self.summary} {self.details or ''}")
+        return self._normalized
+
 
 class IntentResult(BaseModel):
     intent: str
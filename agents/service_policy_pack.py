@@ -1,5 +1,7 @@
 from typing import Any, Dict, List, Tuple
 
+ACCESS_DENIED_TERMS = ("access denied", "not authorized", "permission")
+
 RESTRICTIVENESS = {
     "auto_close": 0,
     "update_only": 1,
@@ -37,7 +39,7 @@ def _contains_access_denied(value: Any) -> bool:
         return any(_contains_access_denied(v) for v in value)
     if isinstance(value, str):
         text = value.lower()
-        return "access denied" in text or "not authorized" in text or "permission" in text
+        return any(term in text for term in ACCESS_DENIED_TERMS)
     return False
 
 
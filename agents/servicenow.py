@@ -1,6 +1,7 @@
 ﻿from typing import Dict, Any
-from .mcp_tools import call_gateway_tool
+from .mcp_tools import acall_gateway_tool, call_gateway_tool
 from .tool_registry import resolve_tool_name
+from .tracing import traced
 
 
 DECISION_TO_STATE = {
@@ -12,8 +13,7 @@ DECISION_TO_STATE = {
 }
 
 
-def update_ticket(payload: Dict[str, Any], decision: str, rca_text: str) -> Dict[str, Any]:
-    tool = resolve_tool_name("update_servicenow_ticket")
+def _ticket_arguments(payload: Dict[str, Any], decision: str, rca_text: str) -> Dict[str, Any]:
     status = DECISION_TO_STATE.get(decision, "In Progress")
 
     ticket_sys_id = payload.get("ticket_sys_id")
@@ -28,10 +28,22 @@ def update_ticket(payload: Dict[str, Any], decision: str, rca_text: str) -> Dict
         "work_notes": rca_text,
     }
 
-    return call_gateway_tool(tool, {
+    return {
         "instance_url": instance_url,
         "username": username,
         "password": password,
         "ticket_sys_id": ticket_sys_id,
         "payload": update_payload,
-    })
+    }
+
+
+@traced("servicenow.update_ticket")
+def update_ticket(payload: Dict[str, Any], decision: str, rca_text: str) -> Dict[str, Any]:
+    tool = resolve_tool_name("update_servicenow_ticket")
+    return call_gateway_tool(tool, _ticket_arguments(payload, decision, rca_text), idempotent=False)
+
+
+@traced("servicenow.update_ticket")
+async def aupdate_ticket(payload: Dict[str, Any], decision: str, rca_text: str) -> Dict[str, Any]:
+    tool = resolve_tool_name("update_servicenow_ticket")
+    return await acall_gateway_tool(tool, _ticket_arguments(payload, decision, rca_text), idempotent=False)
@@ -0,0 +1,95 @@
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Set
+
+Event = Dict[str, Any]
+
+
+class StageEmitter:
+    def __init__(self, incident_id: str, sink: Optional[Callable[[Event], None]] = None) -> None:
+        self.incident_id = incident_id
+        self.sink = sink
+        self.started = time.monotonic()
+        self._seen: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def emit(self, stage: str, data: Any) -> None:
+        if self.sink is None:
+            return
+        with self._lock:
+            self._seen.add(stage)
+        self.sink(
+            {
+                "event": stage,
+                "incident_id": self.incident_id,
+                "elapsed_ms": round((time.monotonic() - self.started) * 1000, 1),
+                "data": data,
+            }
+        )
+
+    def ensure(self, stage: str, data: Any) -> None:
+        if self.sink is None:
+            return
+        with self._lock:
+            if stage in self._seen:
+                return
+        self.emit(stage, data)
+
+    def step(self, evidence_key: str, result: Any, failed: bool) -> None:
+        self.emit("evidence", {"evidence_key": evidence_key, "result": result, "failed": failed})
+
+
+NO_EVENTS = StageEmitter("")
+
+_DONE = object()
+
+
+def iterate_events(incident_id: str, run: Callable[[StageEmitter], Any]) -> Iterator[Event]:
+    events: "queue.Queue[Any]" = queue.Queue()
+    emitter = StageEmitter(incident_id, events.put)
+
+    def _worker() -> None:
+        try:
+            run(emitter)
+        except Exception as exc:
+            emitter.emit("error", {"error": f"{exc.__class__.__name__}: {exc}"})
+        finally:
+            events.put(_DONE)
+
+    threading.Thread(target=_worker, name=f"incident-stream-{incident_id}", daemon=True).start()
+    while True:
+        event = events.get()
+        if event is _DONE:
+            return
+        yield event
+
+
+async def aiterate_events(incident_id: str, run: Callable[[StageEmitter], Awaitable[Any]]) -> AsyncIterator[Event]:
+    loop = asyncio.get_running_loop()
+    events: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    def _put(event: Any) -> None:
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    emitter = StageEmitter(incident_id, _put)
+
+    async def _worker() -> None:
+        try:
+            await run(emitter)
+        except Exception as exc:
+            emitter.emit("error", {"error": f"{exc.__class__.__name__}: {exc}"})
+        finally:
+            _put(_DONE)
+
+    task = asyncio.ensure_future(_worker())
+    try:
+        while True:
+            event = await events.get()
+            if event is _DONE:
+                return
+            yield event
+    finally:
+        if not task.done():
+            task.cancel()
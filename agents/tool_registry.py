@@ -1,23 +1,178 @@
-﻿from typing import Dict, List
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from .config import TOOL_REGISTRY_CACHE_PATH, TOOL_REGISTRY_ERROR_TTL_SECONDS, TOOL_REGISTRY_TTL_SECONDS
+from .gateway_mcp import load_gateway_config
 from .mcp_tools import list_gateway_tools
 
 
-_TOOL_CACHE: Dict[str, str] = {}
+class ToolRegistry:
+    def __init__(self, cache_path: str, ttl: float, error_ttl: float = TOOL_REGISTRY_ERROR_TTL_SECONDS) -> None:
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self._gateway: Optional[str] = None
+        self._names: Dict[str, str] = {}
+        self._fetched_at = 0.0
+        self._retry_at = 0.0
+        self._generation = 0
+        self._loaded = False
+        self._file_attempted = False
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def _gateway_key(self) -> str:
+        if self._gateway is None:
+            try:
+                gateway_url = load_gateway_config().get("gateway_url", "")
+            except (OSError, ValueError):
+                gateway_url = ""
+            self._gateway = hashlib.sha256(gateway_url.encode("utf-8")).hexdigest()[:16]
+        return self._gateway
+
+    def _list_names(self) -> Dict[str, str]:
+        names: Dict[str, str] = {}
+        for tool in list_gateway_tools():
+            name = tool.name
+            names[name] = name
+            if "__" in name:
+                suffix = name.split("__", 1)[1]
+                names[suffix] = name
+        return names
+
+    def _load_file(self) -> None:
+        self._file_attempted = True
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("gateway") != self._gateway_key():
+            return
+        names = data.get("tools")
+        if isinstance(names, dict) and names:
+            self._names = {str(k): str(v) for k, v in names.items()}
+            self._fetched_at = float(data.get("fetched_at", 0.0))
+
+    def _save_file(self) -> None:
+        if not self.cache_path:
+            return
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"gateway": self._gateway_key(), "fetched_at": self._fetched_at, "tools": self._names}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _fetch_locked(self) -> None:
+        self._names = self._list_names()
+        self._fetched_at = time.time()
+        self._generation += 1
+        self._save_file()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if not self._file_attempted:
+                self._load_file()
+            if not self._names:
+                self._fetch_locked()
+            self._loaded = True
+
+    def _background_refresh(self) -> None:
+        try:
+            names = self._list_names()
+            with self._lock:
+                self._names = names
+                self._fetched_at = time.time()
+                self._generation += 1
+                self._save_file()
+        except Exception:
+            self._retry_at = time.time() + self.error_ttl
+        finally:
+            self._refreshing = False
+
+    def _maybe_refresh(self) -> None:
+        if self.ttl <= 0 or self._refreshing:
+            return
+        now = time.time()
+        if now - self._fetched_at < self.ttl or now < self._retry_at:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="tool-registry-refresh", daemon=True).start()
+
+    def peek(self, name: str) -> Optional[str]:
+        if not self._file_attempted:
+            with self._lock:
+                if not self._file_attempted:
+                    self._load_file()
+        return self._names.get(name)
+
+    def preload(self) -> None:
+        self._ensure_loaded()
 
+    def resolve(self, name: str) -> str:
+        self._ensure_loaded()
+        self._maybe_refresh()
+        generation = self._generation
+        resolved = self._names.get(name)
+        if resolved is not None:
+            return resolved
 
-def _build_cache() -> None:
-    tools = list_gateway_tools()
-    for tool in tools:
-        name = tool.name
-        _TOOL_CACHE[name] = name
-        if "__" in name:
-            suffix = name.split("__", 1)[1]
-            _TOOL_CACHE[suffix] = name
+        with self._lock:
+            if self._generation == generation:
+                self._fetch_locked()
+            resolved = self._names.get(name)
+        if resolved is None:
+            raise KeyError(f"Tool not found: {name}")
+        return resolved
+
+    def forget(self, name: str) -> None:
+        with self._lock:
+            if name not in self._names.values():
+                return
+            self._names = {key: value for key, value in self._names.items() if value != name}
+            self._save_file()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._names = {}
+            self._fetched_at = 0.0
+            self._retry_at = 0.0
+            self._loaded = False
+            self._file_attempted = False
+
+
+_registry = ToolRegistry(TOOL_REGISTRY_CACHE_PATH, TOOL_REGISTRY_TTL_SECONDS)
+
+
+def preload_tool_names() -> None:
+    _registry.preload()
+
+
+def lookup_tool_name(name: str) -> Optional[str]:
+    return _registry.peek(name)
 
 
 def resolve_tool_name(name: str) -> str:
-    if not _TOOL_CACHE:
-        _build_cache()
-    if name not in _TOOL_CACHE:
-        raise KeyError(f"Tool not found: {name}")
-    return _TOOL_CACHE[name]
+    return _registry.resolve(name)
+
+
+def forget_tool_name(name: str) -> None:
+    _registry.forget(name)
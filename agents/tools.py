@@ -1,4 +1,4 @@
-﻿from typing import Any, Dict
+﻿from typing import Any, Dict, List, Optional, Sequence, Tuple
 from .config import GATEWAY_URL
 from .gateway_client import AgentcoreGatewayClient
 
@@ -13,5 +13,11 @@ def _get_client() -> AgentcoreGatewayClient:
     return _client
 
 
-def call_tool(tool_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
-    return _get_client().call_tool(tool_name, payload)
+def call_tool(tool_name: str, payload: Dict[str, Any], idempotent: bool = True) -> Dict[str, Any]:
+    return _get_client().call_tool(tool_name, payload, idempotent=idempotent)
+
+
+def call_tools_batch(
+    calls: Sequence[Tuple[str, Dict[str, Any]]], max_workers: Optional[int] = None, idempotent: bool = True
+) -> List[Dict[str, Any]]:
+    return _get_client().call_tools_batch(calls, max_workers=max_workers, idempotent=idempotent)
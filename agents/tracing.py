@@ -0,0 +1,138 @@
+import asyncio
+import contextvars
+import functools
+import itertools
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from .config import TRACE_OTEL, TRACE_TIMINGS
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ENABLED = TRACE_TIMINGS or TRACE_OTEL
+
+_NOOP = nullcontext()
+_ids = itertools.count(1)
+_otel: Any = None
+
+
+class Trace:
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.spans: List[Dict[str, Any]] = []
+
+    def summary(self) -> Dict[str, Any]:
+        by_name: Dict[str, Dict[str, Any]] = {}
+        for record in self.spans:
+            entry = by_name.setdefault(record["name"], {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] = round(entry["total_ms"] + record["duration_ms"], 3)
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "by_name": by_name,
+            "spans": sorted(self.spans, key=lambda record: record["start_ms"]),
+        }
+
+
+_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("incident_trace", default=None)
+_parent: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("trace_parent", default=None)
+
+
+def _otel_tracer() -> Any:
+    global _otel
+    if _otel is None:
+        try:
+            from opentelemetry import trace as otel_trace
+
+            _otel = otel_trace.get_tracer("l1agent")
+        except ImportError:
+            _otel = False
+    return _otel or None
+
+
+class _Span:
+    __slots__ = ("name", "attributes", "trace", "span_id", "parent_id", "token", "otel", "start")
+
+    def __init__(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self) -> "_Span":
+        self.trace = _trace.get() if TRACE_TIMINGS else None
+        self.span_id = next(_ids)
+        self.parent_id = _parent.get()
+        self.token = _parent.set(self.span_id)
+        self.otel = None
+        tracer = _otel_tracer() if TRACE_OTEL else None
+        if tracer is not None:
+            self.otel = tracer.start_as_current_span(
+                self.name, attributes={key: str(value) for key, value in self.attributes.items()}
+            )
+            self.otel.__enter__()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        end = time.perf_counter()
+        _parent.reset(self.token)
+        if self.otel is not None:
+            self.otel.__exit__(exc_type, exc, tb)
+        if self.trace is not None:
+            record: Dict[str, Any] = {
+                "name": self.name,
+                "span_id": self.span_id,
+                "parent_id": self.parent_id,
+                "start_ms": round((self.start - self.trace.started) * 1000, 3),
+                "duration_ms": round((end - self.start) * 1000, 3),
+            }
+            if self.attributes:
+                record["attributes"] = self.attributes
+            if exc_type is not None:
+                record["error"] = exc_type.__name__
+            self.trace.spans.append(record)
+        return False
+
+
+def span(name: str, **attributes: Any) -> Any:
+    if not ENABLED:
+        return _NOOP
+    return _Span(name, attributes)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    def decorator(fn: F) -> F:
+        if not ENABLED:
+            return fn
+
+        if asyncio.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with _Span(name, {}):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _Span(name, {}):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+@contextmanager
+def trace_incident(incident_id: str) -> Iterator[Optional[Trace]]:
+    if not ENABLED:
+        yield None
+        return
+    trace = Trace() if TRACE_TIMINGS else None
+    token = _trace.set(trace)
+    try:
+        with _Span("incident", {"incident_id": incident_id}):
+            yield trace
+    finally:
+        _trace.reset(token)
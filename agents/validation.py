@@ -49,21 +49,70 @@ ORCHESTRATOR_SCHEMA = {
 }
 
 
-def _errors(validator: Draft202012Validator, payload: Dict[str, Any]) -> List[str]:
-    return [e.message for e in validator.iter_errors(payload)]
+_TYPE_CHECKS = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "null": lambda v: v is None,
+}
+
+_FAST_PATH_KEYWORDS = {"type", "properties", "required", "additionalProperties"}
+
+
+class CompiledSchema:
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self.validator = Draft202012Validator(schema)
+        self.required = tuple(schema.get("required", []))
+        properties = schema.get("properties", {})
+        self.property_checks = tuple(
+            (name, _TYPE_CHECKS[spec["type"]])
+            for name, spec in properties.items()
+            if set(spec) == {"type"} and spec["type"] in _TYPE_CHECKS
+        )
+        self.fast_path = (
+            schema.get("type") == "object"
+            and set(schema) <= _FAST_PATH_KEYWORDS
+            and schema.get("additionalProperties", True) is True
+            and len(self.property_checks) == len(properties)
+        )
+
+    def fast_ok(self, payload: Any) -> bool:
+        if not self.fast_path or not isinstance(payload, dict):
+            return False
+        for name in self.required:
+            if name not in payload:
+                return False
+        for name, check in self.property_checks:
+            if name in payload and not check(payload[name]):
+                return False
+        return True
+
+    def errors(self, payload: Any) -> List[str]:
+        if self.fast_ok(payload):
+            return []
+        return [e.message for e in self.validator.iter_errors(payload)]
+
+
+_INTENT = CompiledSchema(INTENT_SCHEMA)
+_INVESTIGATION = CompiledSchema(INVESTIGATION_SCHEMA)
+_ACTION = CompiledSchema(ACTION_SCHEMA)
+_ORCHESTRATOR = CompiledSchema(ORCHESTRATOR_SCHEMA)
 
 
 def validate_intent(payload: Dict[str, Any]) -> List[str]:
-    return _errors(Draft202012Validator(INTENT_SCHEMA), payload)
+    return _INTENT.errors(payload)
 
 
 def validate_investigation(payload: Dict[str, Any]) -> List[str]:
-    return _errors(Draft202012Validator(INVESTIGATION_SCHEMA), payload)
+    return _INVESTIGATION.errors(payload)
 
 
 def validate_action(payload: Dict[str, Any]) -> List[str]:
-    return _errors(Draft202012Validator(ACTION_SCHEMA), payload)
+    return _ACTION.errors(payload)
 
 
 def validate_orchestrator(payload: Dict[str, Any]) -> List[str]:
-    return _errors(Draft202012Validator(ORCHESTRATOR_SCHEMA), payload)
+    return _ORCHESTRATOR.errors(payload)
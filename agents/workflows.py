@@ -2,6 +2,7 @@ from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional
 
 from .schemas import Incident
+from .keywords import EMR_SPINUP_TERMS
 
 
 @dataclass(frozen=True)
@@ -35,14 +36,6 @@ class WorkflowSpec:
     required_action_keys: List[str]
 
 
-def _text(incident: Incident) -> str:
-    return f"{incident.summary} {incident.details or ''}".lower()
-
-
-def _contains_any(text: str, values: List[str]) -> bool:
-    return any(v in text for v in values)
-
-
 WORKFLOWS: Dict[str, WorkflowSpec] = {
     "emr_failure": WorkflowSpec(
         workflow_id="emr_failure",
@@ -189,9 +182,9 @@ WORKFLOWS: Dict[str, WorkflowSpec] = {
 
 
 def select_workflow(intent: str, incident: Incident) -> WorkflowSpec:
-    text = _text(incident)
+    matches = incident.normalized.keywords
 
-    if intent == "emr_failure" and _contains_any(text, ["spin", "bootstrap", "provision", "cluster launch"]):
+    if intent == "emr_failure" and matches.any(EMR_SPINUP_TERMS):
         return WORKFLOWS["emr_spinup_failed"]
 
     if intent in ("dag_failure", "mwaa_failure", "dag_alarm"):
@@ -201,7 +194,7 @@ def select_workflow(intent: str, incident: Incident) -> WorkflowSpec:
         return WORKFLOWS["source_data_failure"]
 
     if intent == "access_denied":
-        if "glue" in text or "glue" in incident.context:
+        if matches.has("glue") or "glue" in incident.context:
             return WORKFLOWS["glue_access_denied"]
         return WORKFLOWS["generic_access_denied"]
 
@@ -1,6 +1,20 @@
 ﻿import base64
 import json
-from typing import Any, Dict, Optional
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+LOG_MAX_EVENTS = int(os.environ.get("LOG_MAX_EVENTS", "500"))
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", "262144"))
+LOG_MAX_MESSAGE_BYTES = int(os.environ.get("LOG_MAX_MESSAGE_BYTES", "4096"))
+LOG_MAX_PAGES = int(os.environ.get("LOG_MAX_PAGES", "20"))
+LOG_ERROR_MATCH_TARGET = int(os.environ.get("LOG_ERROR_MATCH_TARGET", "50"))
+
+ERROR_PATTERN = re.compile(
+    r"\b(error|exception|fatal|fail(?:ed|ure)?|traceback|denied|unauthori[sz]ed|timed? ?out|killed|oom)\b",
+    re.IGNORECASE,
+)
 
 
 def is_api_gateway_event(event: Dict[str, Any]) -> bool:
@@ -66,3 +80,107 @@ def response_error(message: str, status_code: int = 400, event: Optional[Dict[st
         "headers": {"content-type": "application/json"},
         "body": json.dumps(payload),
     }
+
+
+def _int_option(body: Dict[str, Any], key: str, default: int) -> int:
+    value = body.get(key)
+    if value is None or value == "":
+        return default
+    return max(1, int(value))
+
+
+def _clip_message(message: str, max_bytes: int) -> Tuple[str, bool]:
+    encoded = message.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return message, False
+    return encoded[:max_bytes].decode("utf-8", errors="ignore"), True
+
+
+def fetch_log_events(
+    logs_client: Any,
+    log_group: str,
+    body: Dict[str, Any],
+    filter_pattern: str = "",
+) -> Dict[str, Any]:
+    max_events = _int_option(body, "max_events", LOG_MAX_EVENTS)
+    max_bytes = _int_option(body, "max_bytes", LOG_MAX_BYTES)
+    max_message_bytes = _int_option(body, "max_message_bytes", LOG_MAX_MESSAGE_BYTES)
+    max_pages = _int_option(body, "max_pages", LOG_MAX_PAGES)
+    error_target = _int_option(body, "error_match_target", LOG_ERROR_MATCH_TARGET)
+
+    kwargs: Dict[str, Any] = {"logGroupName": log_group, "interleaved": True}
+    if body.get("start_time"):
+        kwargs["startTime"] = int(body["start_time"])
+    if body.get("end_time"):
+        kwargs["endTime"] = int(body["end_time"])
+    if filter_pattern:
+        kwargs["filterPattern"] = filter_pattern
+    if body.get("log_stream_names"):
+        kwargs["logStreamNames"] = list(body["log_stream_names"])
+
+    events: List[Dict[str, Any]] = []
+    total_bytes = 0
+    error_matches = 0
+    clipped_messages = 0
+    pages = 0
+    reason = None
+    next_token = None
+
+    while True:
+        if next_token:
+            kwargs["nextToken"] = next_token
+        kwargs["limit"] = min(10000, max_events - len(events))
+        resp = logs_client.filter_log_events(**kwargs)
+        pages += 1
+        next_token = resp.get("nextToken")
+
+        for e in resp.get("events", []):
+            if len(events) >= max_events:
+                reason = "max_events"
+                break
+            message, clipped = _clip_message(e.get("message") or "", max_message_bytes)
+            size = len(message.encode("utf-8"))
+            if total_bytes + size > max_bytes:
+                reason = "max_bytes"
+                break
+            record = {
+                "timestamp": e.get("timestamp"),
+                "message": message,
+                "log_stream": e.get("logStreamName"),
+            }
+            if clipped:
+                record["message_truncated"] = True
+                clipped_messages += 1
+            events.append(record)
+            total_bytes += size
+            if ERROR_PATTERN.search(message):
+                error_matches += 1
+
+        if reason is not None:
+            break
+        if not next_token:
+            break
+        if len(events) >= max_events:
+            reason = "max_events"
+            break
+        if error_matches >= error_target:
+            reason = "error_match_target"
+            break
+        if pages >= max_pages:
+            reason = "max_pages"
+            break
+
+    return {
+        "events": events,
+        "truncated": reason is not None,
+        "truncation": {
+            "reason": reason,
+            "pages": pages,
+            "event_count": len(events),
+            "bytes": total_bytes,
+            "error_matches": error_matches,
+            "clipped_messages": clipped_messages,
+            "max_events": max_events,
+            "max_bytes": max_bytes,
+        },
+    }
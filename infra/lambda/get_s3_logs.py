@@ -1,4 +1,8 @@
 ﻿import os
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import boto3
 from common import parse_event, response_ok, response_error
@@ -6,12 +10,134 @@ from common import parse_event, response_ok, response_error
 
 s3 = boto3.client("s3")
 
+TAIL_LINES = int(os.environ.get("S3_TAIL_LINES", "50"))
+TAIL_CHUNK_BYTES = int(os.environ.get("S3_TAIL_CHUNK_BYTES", "65536"))
+TAIL_MAX_CHUNK_BYTES = int(os.environ.get("S3_TAIL_MAX_CHUNK_BYTES", "1048576"))
+TAIL_MAX_WORKERS = int(os.environ.get("S3_TAIL_MAX_WORKERS", "8"))
+TAIL_BYTE_BUDGET = int(os.environ.get("S3_TAIL_BYTE_BUDGET", "33554432"))
+TAIL_GZIP_MAX_BYTES = int(os.environ.get("S3_TAIL_GZIP_MAX_BYTES", "8388608"))
+GZIP_SUFFIXES = (".gz", ".gzip")
+
+
+class ByteBudget:
+    def __init__(self, limit):
+        self.remaining = limit
+        self._lock = threading.Lock()
+
+    def take(self, size):
+        with self._lock:
+            granted = max(0, min(size, self.remaining))
+            self.remaining -= granted
+            return granted
+
+
+def _is_gzip(key):
+    return key.lower().endswith(GZIP_SUFFIXES)
+
+
+def _read_range(bucket, key, start, end):
+    resp = s3.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end - 1}")
+    return resp["Body"].read()
+
+
+def tail_plain(bucket, key, size, lines, budget):
+    chunks = []
+    end = size
+    chunk_size = TAIL_CHUNK_BYTES
+    newlines = 0
+    bytes_read = 0
+    while end > 0 and newlines <= lines:
+        granted = budget.take(min(chunk_size, end))
+        if granted <= 0:
+            break
+        start = end - granted
+        data = _read_range(bucket, key, start, end)
+        chunks.append(data)
+        bytes_read += len(data)
+        newlines += data.count(b"\n")
+        end = start
+        chunk_size = min(chunk_size * 2, TAIL_MAX_CHUNK_BYTES)
+
+    text = b"".join(reversed(chunks)).decode("utf-8", errors="replace")
+    tail = text.splitlines()
+    if end > 0 and tail:
+        tail = tail[1:]
+    return tail[-lines:], bytes_read, end > 0 and newlines <= lines
+
+
+def tail_gzip(bucket, key, size, lines, budget, max_bytes):
+    body = s3.get_object(Bucket=bucket, Key=key)["Body"]
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+    tail = deque(maxlen=lines)
+    partial = b""
+    bytes_read = 0
+    truncated = False
+    try:
+        while bytes_read < size:
+            granted = budget.take(min(TAIL_CHUNK_BYTES, max_bytes - bytes_read))
+            if granted <= 0:
+                truncated = True
+                break
+            data = body.read(granted)
+            if not data:
+                break
+            bytes_read += len(data)
+            while data:
+                partial += decompressor.decompress(data)
+                data = decompressor.unused_data
+                if decompressor.eof:
+                    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+                    if not data:
+                        break
+            *complete, partial = partial.split(b"\n")
+            tail.extend(complete)
+            partial = partial[-TAIL_MAX_CHUNK_BYTES:]
+    finally:
+        body.close()
+
+    if not truncated:
+        partial += decompressor.flush()
+        if partial:
+            tail.append(partial)
+    return [line.decode("utf-8", errors="replace").rstrip("\r") for line in tail], bytes_read, truncated
+
+
+def _tail_object(bucket, obj, lines, budget, gzip_max_bytes):
+    key = obj["Key"]
+    size = obj.get("Size", 0)
+    compressed = _is_gzip(key)
+    last_modified = obj.get("LastModified")
+    entry = {
+        "key": key,
+        "last_modified": last_modified.isoformat() if last_modified else "",
+        "size": size,
+        "compressed": compressed,
+    }
+    try:
+        if not size:
+            tail, bytes_read, truncated = [], 0, False
+        elif compressed:
+            tail, bytes_read, truncated = tail_gzip(bucket, key, size, lines, budget, gzip_max_bytes)
+        else:
+            tail, bytes_read, truncated = tail_plain(bucket, key, size, lines, budget)
+    except Exception as exc:
+        entry["error"] = str(exc)
+        return entry
+    entry["preview"] = "\n".join(tail)
+    entry["bytes_read"] = bytes_read
+    if truncated:
+        entry["truncated"] = True
+    return entry
+
 
 def handler(event, _context):
     body = parse_event(event)
     bucket = body.get("bucket") or os.environ.get("LOG_BUCKET") or os.environ.get("RCA_BUCKET")
     prefix = body.get("prefix", "")
     max_objects = int(body.get("max_objects", 5))
+    lines = int(body.get("tail_lines") or TAIL_LINES)
+    byte_budget = int(body.get("max_bytes") or TAIL_BYTE_BUDGET)
+    budget = ByteBudget(byte_budget)
 
     if not bucket:
         return response_error("bucket is required", event=event)
@@ -19,19 +145,21 @@ def handler(event, _context):
     resp = s3.list_objects_v2(Bucket=bucket, Prefix=prefix, MaxKeys=max_objects)
     contents = resp.get("Contents", [])
     contents.sort(key=lambda x: x.get("LastModified", datetime.min), reverse=True)
+    selected = contents[:max_objects]
 
     logs = []
-    for obj in contents[:max_objects]:
-        key = obj["Key"]
-        obj_resp = s3.get_object(Bucket=bucket, Key=key)
-        data = obj_resp["Body"].read()
-        text = data.decode("utf-8", errors="replace")
-        last_modified = obj.get("LastModified")
-        logs.append({
-            "key": key,
-            "last_modified": last_modified.isoformat() if last_modified else "",
-            "size": obj.get("Size", 0),
-            "preview": "\n".join(text.splitlines()[-50:]),
-        })
-
-    return response_ok({"bucket": bucket, "prefix": prefix, "logs": logs}, event=event)
+    if selected:
+        gzip_max_bytes = max(1, min(TAIL_GZIP_MAX_BYTES, byte_budget // len(selected)))
+        with ThreadPoolExecutor(max_workers=max(1, min(len(selected), TAIL_MAX_WORKERS))) as pool:
+            logs = list(pool.map(lambda obj: _tail_object(bucket, obj, lines, budget, gzip_max_bytes), selected))
+
+    return response_ok(
+        {
+            "bucket": bucket,
+            "prefix": prefix,
+            "logs": logs,
+            "bytes_read": sum(log.get("bytes_read", 0) for log in logs),
+            "byte_budget_remaining": budget.remaining,
+        },
+        event=event,
+    )
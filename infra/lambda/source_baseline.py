@@ -0,0 +1,298 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from statistics import median
+from typing import Any, Dict, List, Optional, Tuple
+
+
+BASELINE_STORE = os.environ.get("SOURCE_BASELINE_STORE", "")
+BASELINE_DB_PATH = os.environ.get(
+    "SOURCE_BASELINE_DB_PATH", os.path.join(tempfile.gettempdir(), "source_baseline.db")
+)
+BASELINE_BUCKET = os.environ.get("SOURCE_BASELINE_BUCKET") or os.environ.get("RCA_BUCKET", "")
+BASELINE_KEY_PREFIX = os.environ.get("SOURCE_BASELINE_KEY_PREFIX", "baselines/source_data/")
+BASELINE_MAX_OBSERVATIONS = int(os.environ.get("SOURCE_BASELINE_MAX_OBSERVATIONS", "120"))
+BASELINE_WEEKS = int(os.environ.get("SOURCE_BASELINE_WEEKS", "8"))
+BASELINE_MIN_SAMPLES = int(os.environ.get("SOURCE_BASELINE_MIN_SAMPLES", "3"))
+LOW_VOLUME_RATIO = float(os.environ.get("SOURCE_LOW_VOLUME_RATIO", "0.5"))
+ROBUST_Z_THRESHOLD = float(os.environ.get("SOURCE_ROBUST_Z_THRESHOLD", "3.5"))
+LATE_TOLERANCE_SECONDS = float(os.environ.get("SOURCE_LATE_TOLERANCE_SECONDS", "3600"))
+
+MAD_SCALE = 1.4826
+METRICS = ("total_bytes", "object_count", "arrival_seconds")
+
+_DATE_PATTERNS = (
+    re.compile(r"year=(\d{4})/month=(\d{1,2})/day=(\d{1,2})"),
+    re.compile(r"(?<!\d)(\d{4})[-/_]?(\d{2})[-/_]?(\d{2})(?!\d)"),
+)
+
+
+def partition_date(prefix: str) -> Optional[date]:
+    for pattern in _DATE_PATTERNS:
+        match = pattern.search(prefix)
+        if match:
+            try:
+                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            except ValueError:
+                continue
+    return None
+
+
+def prefix_pattern(prefix: str, delimiter: str = "/") -> str:
+    pattern = prefix.rstrip(delimiter) if delimiter else prefix
+    for date_pattern in _DATE_PATTERNS:
+        pattern = date_pattern.sub("<date>", pattern)
+    return re.sub(r"\d+", "<n>", pattern)
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def observation(partition: Dict[str, Any]) -> Dict[str, Any]:
+    newest = _parse_time(partition.get("newest_last_modified"))
+    day = partition_date(partition["prefix"])
+    arrival = None
+    if day is not None and newest is not None:
+        midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+        arrival = round((newest - midnight).total_seconds(), 1)
+    weekday = day.weekday() if day is not None else (newest.weekday() if newest is not None else None)
+    return {
+        "partition": partition["prefix"],
+        "weekday": weekday,
+        "object_count": partition.get("object_count", 0),
+        "total_bytes": partition.get("total_bytes", 0),
+        "arrival_seconds": arrival,
+        "recorded_at": round(time.time(), 1),
+    }
+
+
+def _robust(values: List[float]) -> Tuple[float, float]:
+    center = median(values)
+    return center, median([abs(value - center) for value in values])
+
+
+def baseline_stats(observations: List[Dict[str, Any]], weekday: Optional[int], exclude: str) -> Optional[Dict[str, Any]]:
+    history = [obs for obs in observations if obs["partition"] != exclude]
+    scope = "weekday"
+    samples = [obs for obs in history if weekday is not None and obs["weekday"] == weekday][-BASELINE_WEEKS:]
+    if len(samples) < BASELINE_MIN_SAMPLES:
+        scope = "all_days"
+        samples = history[-BASELINE_WEEKS * 7 :]
+    if len(samples) < BASELINE_MIN_SAMPLES:
+        return None
+
+    columns = {metric: [obs[metric] for obs in samples if obs.get(metric) is not None] for metric in METRICS}
+    stats: Dict[str, Any] = {"scope": scope, "samples": len(samples)}
+    for metric, values in columns.items():
+        if len(values) >= BASELINE_MIN_SAMPLES:
+            stats[f"median_{metric}"], stats[f"mad_{metric}"] = _robust(values)
+    return stats
+
+
+def _robust_z(value: float, center: float, mad: float) -> Optional[float]:
+    if mad <= 0:
+        return None
+    return (value - center) / (MAD_SCALE * mad)
+
+
+def _is_low(value: float, stats: Dict[str, Any], metric: str) -> bool:
+    center = stats.get(f"median_{metric}")
+    if not center:
+        return False
+    if value >= center * LOW_VOLUME_RATIO:
+        return False
+    z = _robust_z(value, center, stats[f"mad_{metric}"])
+    return z is None or z <= -ROBUST_Z_THRESHOLD
+
+
+def _arrival_limit(stats: Dict[str, Any]) -> Optional[float]:
+    center = stats.get("median_arrival_seconds")
+    if center is None:
+        return None
+    return center + max(LATE_TOLERANCE_SECONDS, ROBUST_Z_THRESHOLD * MAD_SCALE * stats["mad_arrival_seconds"])
+
+
+def classify(
+    target: Dict[str, Any],
+    stats: Optional[Dict[str, Any]],
+    min_objects: int,
+    min_total_bytes: int,
+    now: Optional[datetime] = None,
+) -> Tuple[str, List[str]]:
+    now = now or datetime.now(timezone.utc)
+    current = observation(target)
+    limit = _arrival_limit(stats) if stats else None
+    day = partition_date(target["prefix"])
+
+    if current["object_count"] < min_objects:
+        if limit is not None and day is not None:
+            elapsed = (now - datetime(day.year, day.month, day.day, tzinfo=timezone.utc)).total_seconds()
+            if elapsed <= limit:
+                return "late", [f"No data yet; usually complete within {int(limit)}s of the partition date"]
+        return "missing_data", [f"{current['object_count']} objects found, expected at least {min_objects}"]
+    if current["total_bytes"] < min_total_bytes:
+        return "zero_data", [f"{current['total_bytes']} bytes found, expected at least {min_total_bytes}"]
+    if not stats:
+        return "ok", []
+
+    reasons = []
+    for metric in ("total_bytes", "object_count"):
+        if _is_low(current[metric], stats, metric):
+            reasons.append(f"{metric} {current[metric]} is below the {stats['scope']} median {stats[f'median_{metric}']:g}")
+    if reasons:
+        return "low_volume", reasons
+    if limit is not None and current["arrival_seconds"] is not None and current["arrival_seconds"] > limit:
+        return "late", [f"Last object landed {int(current['arrival_seconds'])}s after the partition date, limit {int(limit)}s"]
+    return "ok", []
+
+
+class SQLiteBaselineStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS source_baseline ("
+                "bucket TEXT NOT NULL, pattern TEXT NOT NULL, partition TEXT NOT NULL, data TEXT NOT NULL, "
+                "PRIMARY KEY (bucket, pattern, partition))"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def load(self, bucket: str, pattern: str) -> List[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT data FROM source_baseline WHERE bucket = ? AND pattern = ? ORDER BY partition",
+                (bucket, pattern),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [json.loads(row[0]) for row in rows]
+
+    def save(self, bucket: str, pattern: str, observations: List[Dict[str, Any]]) -> None:
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM source_baseline WHERE bucket = ? AND pattern = ?", (bucket, pattern))
+                conn.executemany(
+                    "INSERT INTO source_baseline (bucket, pattern, partition, data) VALUES (?, ?, ?, ?)",
+                    [(bucket, pattern, obs["partition"], json.dumps(obs)) for obs in observations],
+                )
+        finally:
+            conn.close()
+
+
+class S3BaselineStore:
+    def __init__(self, s3: Any, bucket: str, key_prefix: str) -> None:
+        self.s3 = s3
+        self.bucket = bucket
+        self.key_prefix = key_prefix
+
+    def _key(self, bucket: str, pattern: str) -> str:
+        digest = hashlib.sha1(f"{bucket}|{pattern}".encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}{digest}.json"
+
+    def load(self, bucket: str, pattern: str) -> List[Dict[str, Any]]:
+        try:
+            resp = self.s3.get_object(Bucket=self.bucket, Key=self._key(bucket, pattern))
+        except self.s3.exceptions.NoSuchKey:
+            return []
+        return json.loads(resp["Body"].read()).get("observations", [])
+
+    def save(self, bucket: str, pattern: str, observations: List[Dict[str, Any]]) -> None:
+        payload = {"bucket": bucket, "pattern": pattern, "observations": observations}
+        self.s3.put_object(
+            Bucket=self.bucket,
+            Key=self._key(bucket, pattern),
+            Body=json.dumps(payload).encode("utf-8"),
+            ContentType="application/json",
+        )
+
+
+def build_store(s3: Any) -> Any:
+    kind = BASELINE_STORE or ("s3" if BASELINE_BUCKET else "sqlite")
+    if kind == "none":
+        return None
+    if kind == "s3":
+        return S3BaselineStore(s3, BASELINE_BUCKET, BASELINE_KEY_PREFIX)
+    if kind == "sqlite":
+        return SQLiteBaselineStore(BASELINE_DB_PATH)
+    raise ValueError(f"Unsupported SOURCE_BASELINE_STORE: {kind}")
+
+
+def _merge(
+    observations: List[Dict[str, Any]], updates: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    merged = {obs["partition"]: obs for obs in observations}
+    for obs in updates:
+        merged[obs["partition"]] = obs
+    return [merged[key] for key in sorted(merged)][-BASELINE_MAX_OBSERVATIONS:]
+
+
+def assess(
+    store: Any,
+    bucket: str,
+    prefix: str,
+    scan: Dict[str, Any],
+    min_objects: int,
+    min_total_bytes: int,
+    delimiter: str = "/",
+) -> Dict[str, Any]:
+    partitions = scan.get("partitions") or []
+    if partitions:
+        dated = [partition for partition in partitions if partition_date(partition["prefix"]) is not None]
+        target = (dated or partitions)[-1]
+        history = [partition for partition in partitions if partition is not target]
+        min_objects, min_total_bytes = 1, 1
+    else:
+        target = {
+            "prefix": prefix,
+            "object_count": scan["object_count"],
+            "total_bytes": scan["total_bytes"],
+            "newest_last_modified": scan.get("newest_last_modified"),
+        }
+        history = []
+
+    pattern = prefix_pattern(target["prefix"], delimiter)
+    observations = store.load(bucket, pattern) if store is not None else []
+    updates = [observation(partition) for partition in history if prefix_pattern(partition["prefix"], delimiter) == pattern]
+    known = _merge(observations, updates)
+
+    current = observation(target)
+    stats = baseline_stats(known, current["weekday"], exclude=target["prefix"])
+    status, reasons = classify(target, stats, min_objects, min_total_bytes)
+
+    if status == "ok":
+        updates.append(current)
+    save_error = None
+    if store is not None and updates:
+        try:
+            store.save(bucket, pattern, _merge(observations, updates))
+        except Exception as exc:
+            save_error = f"{exc.__class__.__name__}: {exc}"
+
+    baseline: Dict[str, Any] = {"pattern": pattern, "partition": target["prefix"], "observed": current}
+    if stats:
+        baseline.update(stats)
+        if stats.get("median_total_bytes"):
+            baseline["volume_ratio"] = round(current["total_bytes"] / stats["median_total_bytes"], 3)
+    result = {"status": status, "status_reasons": reasons, "baseline": baseline}
+    if save_error:
+        result["baseline_error"] = save_error
+    return result
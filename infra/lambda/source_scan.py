@@ -0,0 +1,135 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+
+SCAN_MAX_WORKERS = int(os.environ.get("SOURCE_SCAN_MAX_WORKERS", "8"))
+ZERO_BYTE_SAMPLE = int(os.environ.get("SOURCE_SCAN_ZERO_BYTE_SAMPLE", "20"))
+MAX_PARTITIONS = int(os.environ.get("SOURCE_SCAN_MAX_PARTITIONS", "100"))
+
+
+class PrefixStats:
+    __slots__ = ("prefix", "object_count", "total_bytes", "zero_byte_count", "zero_byte_sample", "newest", "oldest")
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.object_count = 0
+        self.total_bytes = 0
+        self.zero_byte_count = 0
+        self.zero_byte_sample: List[str] = []
+        self.newest: Optional[datetime] = None
+        self.oldest: Optional[datetime] = None
+
+    def add(self, obj: Dict[str, Any], sample_size: int) -> None:
+        size = obj.get("Size", 0)
+        self.object_count += 1
+        self.total_bytes += size
+        if size == 0:
+            self.zero_byte_count += 1
+            if len(self.zero_byte_sample) < sample_size:
+                self.zero_byte_sample.append(obj["Key"])
+        modified = obj.get("LastModified")
+        if modified is not None:
+            if self.newest is None or modified > self.newest:
+                self.newest = modified
+            if self.oldest is None or modified < self.oldest:
+                self.oldest = modified
+
+    def merge(self, other: "PrefixStats", sample_size: int) -> None:
+        self.object_count += other.object_count
+        self.total_bytes += other.total_bytes
+        self.zero_byte_count += other.zero_byte_count
+        self.zero_byte_sample.extend(other.zero_byte_sample[: max(0, sample_size - len(self.zero_byte_sample))])
+        if other.newest is not None and (self.newest is None or other.newest > self.newest):
+            self.newest = other.newest
+        if other.oldest is not None and (self.oldest is None or other.oldest < self.oldest):
+            self.oldest = other.oldest
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "prefix": self.prefix,
+            "object_count": self.object_count,
+            "total_bytes": self.total_bytes,
+            "zero_byte_count": self.zero_byte_count,
+            "newest_last_modified": self.newest.isoformat() if self.newest else None,
+            "oldest_last_modified": self.oldest.isoformat() if self.oldest else None,
+        }
+
+
+def _pages(s3: Any, bucket: str, prefix: str, delimiter: str = "") -> Any:
+    kwargs = {"Bucket": bucket, "Prefix": prefix}
+    if delimiter:
+        kwargs["Delimiter"] = delimiter
+    return s3.get_paginator("list_objects_v2").paginate(**kwargs)
+
+
+def scan_prefix(s3: Any, bucket: str, prefix: str, sample_size: int = ZERO_BYTE_SAMPLE) -> PrefixStats:
+    stats = PrefixStats(prefix)
+    for page in _pages(s3, bucket, prefix):
+        for obj in page.get("Contents", []):
+            stats.add(obj, sample_size)
+    return stats
+
+
+def split_prefix(
+    s3: Any, bucket: str, prefix: str, delimiter: str, sample_size: int = ZERO_BYTE_SAMPLE
+) -> Tuple[PrefixStats, List[str]]:
+    direct = PrefixStats(prefix)
+    children: List[str] = []
+    for page in _pages(s3, bucket, prefix, delimiter):
+        for obj in page.get("Contents", []):
+            direct.add(obj, sample_size)
+        children.extend(entry["Prefix"] for entry in page.get("CommonPrefixes", []))
+    return direct, list(dict.fromkeys(children))
+
+
+def _age_seconds(newest: Optional[datetime], now: datetime) -> Optional[float]:
+    if newest is None:
+        return None
+    if newest.tzinfo is None:
+        newest = newest.replace(tzinfo=timezone.utc)
+    return round((now - newest).total_seconds(), 1)
+
+
+def verify_prefix(
+    s3: Any,
+    bucket: str,
+    prefix: str,
+    delimiter: str = "/",
+    split: bool = True,
+    max_workers: int = SCAN_MAX_WORKERS,
+    sample_size: int = ZERO_BYTE_SAMPLE,
+    max_partitions: int = MAX_PARTITIONS,
+) -> Dict[str, Any]:
+    if split and delimiter:
+        total, children = split_prefix(s3, bucket, prefix, delimiter, sample_size)
+    else:
+        total, children = scan_prefix(s3, bucket, prefix, sample_size), []
+
+    partitions: List[PrefixStats] = []
+    if children:
+        with ThreadPoolExecutor(max_workers=max(1, min(len(children), max_workers))) as pool:
+            partitions = list(pool.map(lambda child: scan_prefix(s3, bucket, child, sample_size), children))
+        for partition in partitions:
+            total.merge(partition, sample_size)
+
+    now = datetime.now(timezone.utc)
+    reported = partitions[-max_partitions:] if max_partitions > 0 else []
+    summaries = []
+    for partition in reported:
+        summary = partition.summary()
+        summary["age_seconds"] = _age_seconds(partition.newest, now)
+        summaries.append(summary)
+    return {
+        "object_count": total.object_count,
+        "total_bytes": total.total_bytes,
+        "zero_byte_count": total.zero_byte_count,
+        "zero_byte_objects": total.zero_byte_sample,
+        "zero_byte_objects_truncated": total.zero_byte_count > len(total.zero_byte_sample),
+        "newest_last_modified": total.newest.isoformat() if total.newest else None,
+        "age_seconds": _age_seconds(total.newest, now),
+        "partition_count": len(partitions),
+        "partitions": summaries,
+        "partitions_truncated": len(partitions) > len(summaries),
+    }
@@ -1,9 +1,17 @@
 ﻿import os
 import boto3
 from common import parse_event, response_ok, response_error
+from source_baseline import assess, build_store
+from source_scan import MAX_PARTITIONS, SCAN_MAX_WORKERS, ZERO_BYTE_SAMPLE, verify_prefix
 
 
 s3 = boto3.client("s3")
+baseline_store_error = None
+try:
+    baseline_store = build_store(s3)
+except Exception as exc:
+    baseline_store = None
+    baseline_store_error = f"{exc.__class__.__name__}: {exc}"
 
 
 def handler(event, _context):
@@ -16,22 +24,40 @@ def handler(event, _context):
     if not bucket:
         return response_error("bucket is required", event=event)
 
-    resp = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
-    contents = resp.get("Contents", [])
-    total_bytes = sum(obj.get("Size", 0) for obj in contents)
-    zero_objects = [obj["Key"] for obj in contents if obj.get("Size", 0) == 0]
+    delimiter = body.get("delimiter", "/")
+    scan = verify_prefix(
+        s3,
+        bucket,
+        prefix,
+        delimiter=delimiter,
+        split=str(body.get("split_partitions", True)).lower() not in ("false", "0"),
+        max_workers=int(body.get("max_workers") or SCAN_MAX_WORKERS),
+        sample_size=int(body.get("zero_byte_sample") or ZERO_BYTE_SAMPLE),
+        max_partitions=int(body.get("max_partitions") or MAX_PARTITIONS),
+    )
 
     status = "ok"
-    if len(contents) < min_objects:
+    if scan["object_count"] < min_objects:
         status = "missing_data"
-    elif total_bytes < min_total_bytes:
+    elif scan["total_bytes"] < min_total_bytes:
         status = "zero_data"
 
+    use_baseline = str(body.get("use_baseline", True)).lower() not in ("false", "0")
+    store = baseline_store if use_baseline else None
+    try:
+        anomaly = assess(store, bucket, prefix, scan, min_objects, min_total_bytes, delimiter)
+    except Exception as exc:
+        anomaly = {"status": status, "baseline_error": f"{exc.__class__.__name__}: {exc}"}
+    if use_baseline and baseline_store_error:
+        anomaly.setdefault("baseline_error", baseline_store_error)
+    anomaly_status = anomaly.pop("status")
+    if status == "ok" or anomaly_status == "late":
+        status = anomaly_status
+
     return response_ok({
         "bucket": bucket,
         "prefix": prefix,
-        "object_count": len(contents),
-        "total_bytes": total_bytes,
-        "zero_byte_objects": zero_objects,
+        **scan,
+        **anomaly,
         "status": status,
     }, event=event)
@@ -0,0 +1,53 @@
+import argparse
+import os
+import time
+
+import boto3
+
+os.environ.setdefault("AWS_REGION", "us-east-1")
+
+from agents.aws_clients import clear_clients, get_client  # noqa: E402
+from agents.config import AWS_REGION  # noqa: E402
+
+# Clients touched per incident: governance control/runtime plus the RCA write.
+INCIDENT_SERVICES = ["bedrock-agentcore-control", "bedrock-agentcore", "s3"]
+
+
+def _per_incident_legacy(services: list[str]) -> None:
+    for service in services:
+        boto3.client(service, region_name=AWS_REGION)
+
+
+def _per_incident_pooled(services: list[str]) -> None:
+    for service in services:
+        get_client(service, AWS_REGION)
+
+
+def _bench(label: str, fn, services: list[str], iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(services)
+    elapsed = time.perf_counter() - started
+    per_incident_ms = elapsed / iterations * 1000.0
+    print(f"{label:<8} {iterations} incidents in {elapsed:.3f}s -> {per_incident_ms:.3f} ms/incident")
+    return per_incident_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    available = set(boto3.session.Session().get_available_services())
+    services = [s for s in INCIDENT_SERVICES if s in available]
+    print(f"Services per incident: {', '.join(services)}")
+
+    legacy = _bench("legacy", _per_incident_legacy, services, args.iterations)
+    clear_clients()
+    pooled = _bench("pooled", _per_incident_pooled, services, args.iterations)
+    if pooled > 0:
+        print(f"Speedup: {legacy / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
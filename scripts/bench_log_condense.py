@@ -0,0 +1,62 @@
+import argparse
+import json
+import random
+import time
+
+from agents.log_condense import condense_log_evidence
+from agents.service_policy_pack import _contains_access_denied
+
+
+def _events(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    events = []
+    for index in range(count):
+        roll = rng.random()
+        if roll < 0.02:
+            message = (
+                f"2024-05-01T10:{index % 60:02d}:00Z ERROR AccessDeniedException: User "
+                f"arn:aws:iam::123456789012:role/glue-{index} is not authorized to perform glue:GetTable "
+                f"on table db_{index % 7}.orders_{index}"
+            )
+        elif roll < 0.05:
+            message = (
+                f"WARN YarnAllocator: Container container_{index}_01 on host ip-10-0-{index % 255}-1 "
+                f"exited with code {rng.choice([137, 143])}"
+            )
+        else:
+            message = (
+                f"INFO TaskSetManager: Finished task {index % 200}.0 in stage {index % 40}.0 "
+                f"(TID {index}) in {rng.randint(1, 900)} ms on 10.0.{index % 255}.{rng.randint(1, 254)} (executor {index % 16})"
+            )
+        events.append({"timestamp": 1714557600000 + index * 10, "message": message, "log_stream": "driver"})
+    return events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = {"log_group": "/aws-glue/jobs/error", "events": _events(args.events, 7), "truncated": False}
+
+    started = time.perf_counter()
+    for _ in range(args.runs):
+        condensed = condense_log_evidence(raw)
+    condense_ms = (time.perf_counter() - started) / args.runs * 1000.0
+
+    raw_bytes = len(json.dumps(raw))
+    condensed_bytes = len(json.dumps(condensed))
+    print(f"{args.events} events: raw={raw_bytes / 1024:.1f} KiB condensed={condensed_bytes / 1024:.1f} KiB")
+    print(f"condense {condense_ms:8.2f} ms  templates={condensed['condensed']['template_count']}")
+
+    for label, evidence in (("raw", raw), ("condensed", condensed)):
+        started = time.perf_counter()
+        for _ in range(args.runs):
+            _contains_access_denied(evidence)
+            json.dumps(evidence)
+        print(f"{label:<9} scan+serialize {(time.perf_counter() - started) / args.runs * 1000.0:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
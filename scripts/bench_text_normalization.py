@@ -0,0 +1,70 @@
+import argparse
+import time
+import tracemalloc
+
+from agents.keywords import MATCHER
+from agents.schemas import Incident
+
+# Stages that previously rebuilt the lower-cased incident text on their own.
+STAGES = ["is_non_incident_access_request", "classify_intent", "select_workflow", "evaluate_workflow"]
+
+STACK_FRAME = "    at org.apache.spark.scheduler.DAGScheduler.failJobAndIndependentStages(DAGScheduler.scala:2454)\n"
+
+
+def _incident(index: int, trace_lines: int) -> Incident:
+    return Incident(
+        incident_id=f"BENCH-{index}",
+        summary="Glue ETL job daily_orders_etl failed with AccessDeniedException",
+        details="org.apache.spark.SparkException: Job aborted due to stage failure\n" + STACK_FRAME * trace_lines,
+    )
+
+
+def _legacy(incident: Incident) -> None:
+    for _ in STAGES:
+        text = f"{incident.summary} {incident.details or ''}".lower()
+        MATCHER.scan(text)
+
+
+def _shared(incident: Incident) -> None:
+    for _ in STAGES:
+        incident.normalized.keywords
+
+
+def _measure(label: str, fn, count: int, trace_lines: int) -> None:
+    peaks = 0
+    elapsed = 0.0
+    tracemalloc.start()
+    for index in range(count):
+        incident = _incident(index, trace_lines)
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        fn(incident)
+        elapsed += time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        peaks += peak - baseline
+        del incident
+    tracemalloc.stop()
+
+    print(f"{label:<7} {elapsed / count * 1000.0:8.3f} ms/incident  peak_alloc={peaks / count / 1024:8.1f} KiB/incident")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--incidents", type=int, default=200)
+    parser.add_argument("--trace-lines", type=int, default=60)
+    args = parser.parse_args()
+
+    text_len = len(_incident(0, args.trace_lines).normalized.raw)
+    print(f"{args.incidents} incidents, {text_len} chars of text each, {len(STAGES)} stages")
+    print(
+        f"text copies per incident: legacy={2 * len(STAGES)} ({2 * len(STAGES) * text_len / 1024:.1f} KiB) "
+        f"shared=2 ({2 * text_len / 1024:.1f} KiB)"
+    )
+
+    _measure("legacy", _legacy, args.incidents, args.trace_lines)
+    _measure("shared", _shared, args.incidents, args.trace_lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+import argparse
+import time
+
+from jsonschema import Draft202012Validator
+
+from agents.validation import (
+    ACTION_SCHEMA,
+    INTENT_SCHEMA,
+    INVESTIGATION_SCHEMA,
+    ORCHESTRATOR_SCHEMA,
+    validate_action,
+    validate_intent,
+    validate_investigation,
+    validate_orchestrator,
+)
+
+INTENT = {"intent": "glue_etl_failure", "confidence": 0.6, "rationale": "Matched keyword glue/etl"}
+INVESTIGATION = {"intent": "glue_etl_failure", "evidence": {"glue_logs": {"events": []}}}
+ACTION = {"intent": "glue_etl_failure", "actions": [{"retry_glue_job": {"status": "submitted"}}], "status": "completed"}
+ORCHESTRATOR = {
+    "incident_id": "INC-1",
+    "intent": INTENT,
+    "investigation": INVESTIGATION,
+    "actions": ACTION,
+    "policy": {"decision": "auto_retry"},
+    "rca": {"incident_id": "INC-1"},
+}
+
+CASES = [
+    ("intent", INTENT_SCHEMA, validate_intent, INTENT),
+    ("investigation", INVESTIGATION_SCHEMA, validate_investigation, INVESTIGATION),
+    ("action", ACTION_SCHEMA, validate_action, ACTION),
+    ("orchestrator", ORCHESTRATOR_SCHEMA, validate_orchestrator, ORCHESTRATOR),
+]
+
+
+def _legacy(schema: dict, payload: dict) -> list[str]:
+    return [e.message for e in Draft202012Validator(schema).iter_errors(payload)]
+
+
+def _rate(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'schema':<14} {'legacy/s':>12} {'compiled/s':>12} {'speedup':>8}")
+    for name, schema, validate, payload in CASES:
+        legacy = _rate(lambda: _legacy(schema, payload), args.iterations)
+        compiled = _rate(lambda: validate(payload), args.iterations)
+        print(f"{name:<14} {legacy:>12.0f} {compiled:>12.0f} {compiled / legacy:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
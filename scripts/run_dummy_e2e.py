@@ -29,6 +29,12 @@ def _install_stubs() -> None:
         def __init__(self, *args, **kwargs):
             pass
 
+        def start(self):
+            return self
+
+        def stop(self, exc_type, exc_val, exc_tb):
+            return None
+
         def list_tools_sync(self):
             names = [
                 "mock__get_emr_logs",
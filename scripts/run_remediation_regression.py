@@ -0,0 +1,144 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from agents.remediation import MemoryBackend, RemediationGuard, SQLiteBackend, remediation_key
+
+
+CTX = {"job_name": "orders_daily", "run_id": "jr_1"}
+
+
+class _Tool:
+    def __init__(self, results: List[Any], delay: float = 0.0) -> None:
+        self.results = list(results)
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self) -> Any:
+        self.calls += 1
+        time.sleep(self.delay)
+        result = self.results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    async def acall(self) -> Any:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        result = self.results.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+def _backends() -> List[Tuple[str, Callable[[], Any]]]:
+    directory = tempfile.mkdtemp(prefix="remediation-regression-")
+    return [
+        ("memory", MemoryBackend),
+        ("sqlite", lambda: SQLiteBackend(os.path.join(directory, f"{os.urandom(4).hex()}.db"))),
+    ]
+
+
+def _case_error_result_not_cooled_down(backend: Any) -> List[str]:
+    guard = RemediationGuard(backend, cooldown=300)
+    tool = _Tool([{"is_error": True, "content": ["ThrottlingException"]}, {"is_error": False, "content": ["ok"]}])
+    first = guard.run("retry_glue_job", CTX, tool)
+    second = guard.run("retry_glue_job", CTX, tool)
+    issues = []
+    if not first.get("is_error"):
+        issues.append(f"first result expected is_error, got {first}")
+    if "deduplicated" in second or tool.calls != 2:
+        issues.append(f"retry after error blocked: calls={tool.calls} second={second}")
+    return issues
+
+
+def _case_async_error_result_not_cooled_down(backend: Any) -> List[str]:
+    guard = RemediationGuard(backend, cooldown=300)
+    tool = _Tool([{"isError": True, "content": [{"text": "InternalFailure"}]}, {"isError": False, "content": []}])
+
+    async def _run() -> Tuple[Any, Any]:
+        first = await guard.arun("retry_emr", CTX, tool.acall)
+        second = await guard.arun("retry_emr", CTX, tool.acall)
+        return first, second
+
+    first, second = asyncio.run(_run())
+    if "deduplicated" in second or tool.calls != 2:
+        return [f"async retry after error blocked: calls={tool.calls} first={first} second={second}"]
+    return []
+
+
+def _case_success_cooled_down(backend: Any) -> List[str]:
+    guard = RemediationGuard(backend, cooldown=300)
+    tool = _Tool([{"is_error": False, "content": ["ok"]}, {"is_error": False, "content": ["ok"]}])
+    guard.run("retry_glue_job", CTX, tool)
+    second = guard.run("retry_glue_job", CTX, tool)
+    if second.get("deduplicated") != "cooldown" or tool.calls != 1:
+        return [f"success did not start cooldown: calls={tool.calls} second={second}"]
+    return []
+
+
+def _case_exception_not_cooled_down(backend: Any) -> List[str]:
+    guard = RemediationGuard(backend, cooldown=300)
+    tool = _Tool([RuntimeError("502 Bad Gateway"), {"is_error": False, "content": ["ok"]}])
+    try:
+        guard.run("retry_glue_job", CTX, tool)
+    except RuntimeError:
+        pass
+    second = guard.run("retry_glue_job", CTX, tool)
+    if "deduplicated" in second or tool.calls != 2:
+        return [f"retry after exception blocked: calls={tool.calls} second={second}"]
+    return []
+
+
+def _case_followers_share_error(backend: Any) -> List[str]:
+    guard = RemediationGuard(backend, cooldown=300, wait=5)
+    tool = _Tool([{"is_error": True, "content": ["ThrottlingException"]}], delay=0.2)
+    results: Dict[int, Any] = {}
+
+    def _call(index: int) -> None:
+        results[index] = guard.run("retry_glue_job", CTX, tool)
+
+    threads = [threading.Thread(target=_call, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    issues = []
+    if tool.calls != 1:
+        issues.append(f"concurrent calls expected 1 invocation, got {tool.calls}")
+    if len(results) != 4 or backend.lookup(remediation_key("retry_glue_job", CTX)):
+        issues.append(f"followers not settled or cooldown recorded: results={results}")
+    return issues
+
+
+CASES = [
+    ("error result does not start cooldown", _case_error_result_not_cooled_down),
+    ("async error result does not start cooldown", _case_async_error_result_not_cooled_down),
+    ("successful result starts cooldown", _case_success_cooled_down),
+    ("exception does not start cooldown", _case_exception_not_cooled_down),
+    ("followers settle on error result", _case_followers_share_error),
+]
+
+
+def main() -> None:
+    total = 0
+    passed = 0
+    for backend_name, factory in _backends():
+        for name, case in CASES:
+            total += 1
+            issues = case(factory())
+            status = "PASS" if not issues else "FAIL"
+            print(f"{status}: [{backend_name}] {name}")
+            for issue in issues:
+                print(f"  - {issue}")
+            if not issues:
+                passed += 1
+
+    print(f"Passed {passed}/{total} cases")
+
+
+if __name__ == "__main__":
+    main()